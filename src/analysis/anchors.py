@@ -2,8 +2,10 @@
 
 import re
 import json
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, replace
+from ..util.hashing import content_hash
 
 @dataclass
 class Anchor:
@@ -203,3 +205,27 @@ class AnchorExtractor:
                 found_phrases.append(phrase)
         
         return found_phrases
+
+
+# Anchors of recently seen conversations, keyed on a hash of their message
+# contents and kept in least-recently-used order
+_ANCHOR_CACHE: "OrderedDict[str, Tuple[Anchor, ...]]" = OrderedDict()
+ANCHOR_CACHE_SIZE = 32
+
+
+def extract_anchors_cached(messages: List[Dict[str, Any]]) -> List[Anchor]:
+    """Extract anchors, reusing the result for recently seen conversations.
+    
+    Anchors depend only on message contents, so the cache is keyed on a hash
+    of them. Callers get their own copies and may modify them freely.
+    """
+    key = content_hash({'contents': [msg.get('content', '') for msg in messages]})
+    anchors = _ANCHOR_CACHE.get(key)
+    if anchors is None:
+        anchors = tuple(AnchorExtractor().extract_anchors(messages))
+        _ANCHOR_CACHE[key] = anchors
+        if len(_ANCHOR_CACHE) > ANCHOR_CACHE_SIZE:
+            _ANCHOR_CACHE.popitem(last=False)
+    else:
+        _ANCHOR_CACHE.move_to_end(key)
+    return [replace(anchor, tags=list(anchor.tags)) for anchor in anchors]
@@ -1,15 +1,79 @@
 """Comprehensive comparison system for all summarizer types."""
 
+import importlib
 import json
+import re
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable, Iterator, List
 from ..util.schema import NormalizedConversation, SubstackDraft
-from .specialized_summarizers import summarize_conversation_technical_journal
-from .research_article_summarizer import summarize_conversation_research_article
-from .critique_summarizer import summarize_conversation_critique
-from .enhanced_summarizer import summarize_conversation_enhanced
-from .journal_summarizer import summarize_conversation_journal
-from .narrative_summarizer import summarize_conversation_narrative
+
+NL = "\n"
+
+# Summarizer entry points as (module, function) pairs. They are imported lazily
+# so that importing this module does not drag in every summarizer.
+SUMMARIZER_ENTRY_POINTS = {
+    "technical_journal": (".specialized_summarizers", "summarize_conversation_technical_journal"),
+    "research_article": (".research_article_summarizer", "summarize_conversation_research_article"),
+    "critique": (".critique_summarizer", "summarize_conversation_critique"),
+    "enhanced": (".enhanced_summarizer", "summarize_conversation_enhanced"),
+    "journal": (".journal_summarizer", "summarize_conversation_journal"),
+    "narrative": (".narrative_summarizer", "summarize_conversation_narrative"),
+}
+
+# Keyword buckets for the content quality indicators. They are compiled into a
+# single zero-width alternation so one scan over the draft reports every bucket
+# that fired, including needles that overlap each other.
+QUALITY_INDICATORS = {
+    "flow": ['however', 'therefore', 'moreover', 'furthermore', 'consequently'],
+    "technical": ['```', 'code', 'python', 'javascript', 'api', 'cli', 'install', 'command', 'config', 'yaml'],
+    "voice": ['i think', 'my opinion', 'i believe', 'i found myself', 'my journey', 'i learned'],
+}
+QUALITY_INDICATOR_PATTERN = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{bucket}>{'|'.join(map(re.escape, keywords))})"
+        for bucket, keywords in QUALITY_INDICATORS.items()
+    ) + ")"
+)
+
+
+def _quality_buckets_seen(text_lower: str) -> set:
+    """Return the names of the quality indicator buckets present in the text."""
+    seen = set()
+    for match in QUALITY_INDICATOR_PATTERN.finditer(text_lower):
+        seen.add(match.lastgroup)
+        if len(seen) == len(QUALITY_INDICATORS):
+            break
+    return seen
+
+
+class LazySummarizers(MutableMapping):
+    """Maps summarizer names to functions, importing each entry point on first access."""
+    
+    def __init__(self, entry_points: Dict[str, tuple]):
+        # Values are (module, function) pairs until resolved, then the function itself
+        self._summarizers: Dict[str, Any] = dict(entry_points)
+    
+    def __getitem__(self, name: str) -> Callable[[NormalizedConversation], SubstackDraft]:
+        summarizer = self._summarizers[name]
+        if isinstance(summarizer, tuple):
+            module_name, func_name = summarizer
+            module = importlib.import_module(module_name, package=__package__)
+            summarizer = self._summarizers[name] = getattr(module, func_name)
+        return summarizer
+    
+    def __setitem__(self, name: str, summarizer: Callable[[NormalizedConversation], SubstackDraft]):
+        self._summarizers[name] = summarizer
+    
+    def __delitem__(self, name: str):
+        del self._summarizers[name]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._summarizers)
+    
+    def __len__(self) -> int:
+        return len(self._summarizers)
 
 
 class ComprehensiveComparison:
@@ -19,29 +83,23 @@ class ComprehensiveComparison:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        self.summarizers = {
-            "technical_journal": summarize_conversation_technical_journal,
-            "research_article": summarize_conversation_research_article,
-            "critique": summarize_conversation_critique,
-            "enhanced": summarize_conversation_enhanced,
-            "journal": summarize_conversation_journal,
-            "narrative": summarize_conversation_narrative,
-        }
+        self.summarizers = LazySummarizers(SUMMARIZER_ENTRY_POINTS)
     
     def _evaluate_draft_quality(self, draft: SubstackDraft, style: str) -> Dict[str, Any]:
         """Evaluates the quality of a draft based on the expected style."""
-        full_text = f"{draft.title} {draft.dek} {' '.join(draft.tldr)} {draft.body_markdown}"
-        full_text_lower = full_text.lower()
-        
         # Basic metrics
         word_count = len(draft.body_markdown.split())
         tldr_count = len(draft.tldr)
         tag_count = len(draft.tags)
         
+        full_text = f"{draft.title} {draft.dek} {' '.join(draft.tldr)} {draft.body_markdown}"
+        full_text_lower = full_text.lower()
+        
         # Content quality indicators
-        has_narrative_flow = word_count > 200 and any(connector in full_text_lower for connector in ['however', 'therefore', 'moreover', 'furthermore', 'consequently'])
-        has_technical_details = any(tech in full_text_lower for tech in ['```', 'code', 'python', 'javascript', 'api', 'cli', 'install', 'command', 'config', 'yaml'])
-        has_personal_voice = any(pronoun in full_text_lower for pronoun in ['i think', 'my opinion', 'i believe', 'i found myself', 'my journey', 'i learned'])
+        buckets_seen = _quality_buckets_seen(full_text_lower)
+        has_narrative_flow = word_count > 200 and "flow" in buckets_seen
+        has_technical_details = "technical" in buckets_seen
+        has_personal_voice = "voice" in buckets_seen
         has_structure = any(section in full_text for section in ['##', '###'])
         
         # Style-specific checks
@@ -98,35 +156,51 @@ class ComprehensiveComparison:
         else:
             return "Poor"
     
+    def _run_summarizer(self, name: str, conversation: NormalizedConversation) -> Dict[str, Any]:
+        """Run one summarizer and evaluate its draft."""
+        try:
+            print(f"  - Running {name} summarizer...")
+            summarizer_func = self.summarizers[name]
+            draft = summarizer_func(conversation)
+            quality_metrics = self._evaluate_draft_quality(draft, name)
+            
+            return {
+                "draft": draft,
+                "quality_metrics": quality_metrics,
+                "title": draft.title,
+                "dek": draft.dek,
+                "tldr": draft.tldr,
+                "tags": draft.tags,
+                "word_count": quality_metrics["word_count"],
+                "overall_quality": quality_metrics["overall_quality"]
+            }
+            
+        except Exception as e:
+            print(f"  - Error with {name}: {str(e)}")
+            return {"error": str(e)}
+    
     def run_comprehensive_comparison(self, conversation: NormalizedConversation) -> Path:
         """Runs all summarizers and generates a comprehensive comparison report."""
         results = {}
         
         print(f"Running comprehensive comparison on conversation with {len(conversation.messages)} messages...")
         
-        for name, summarizer_func in self.summarizers.items():
-            try:
-                print(f"  - Running {name} summarizer...")
-                draft = summarizer_func(conversation)
-                quality_metrics = self._evaluate_draft_quality(draft, name)
-                
-                results[name] = {
-                    "draft": draft,
-                    "quality_metrics": quality_metrics,
-                    "title": draft.title,
-                    "dek": draft.dek,
-                    "tldr": draft.tldr,
-                    "tags": draft.tags,
-                    "word_count": quality_metrics["word_count"],
-                    "overall_quality": quality_metrics["overall_quality"]
-                }
-                
-                # Save individual draft for review
-                self._save_individual_draft(name, draft)
-                
-            except Exception as e:
-                print(f"  - Error with {name}: {str(e)}")
-                results[name] = {"error": str(e)}
+        # Summarizers run one after another on this thread; only the draft
+        # writes are handed to a background writer so they overlap the next run
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            pending_writes = {}
+            for name in self.summarizers:
+                results[name] = self._run_summarizer(name, conversation)
+                if "error" not in results[name]:
+                    # Save individual draft for review
+                    pending_writes[name] = writer.submit(self._save_individual_draft, name, results[name]["draft"])
+            
+            for name, future in pending_writes.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"  - Error with {name}: {str(e)}")
+                    results[name] = {"error": str(e)}
         
         # Generate comprehensive report
         report_path = self._generate_comprehensive_report(results)
@@ -138,12 +212,14 @@ class ComprehensiveComparison:
     
     def _save_individual_draft(self, name: str, draft: SubstackDraft):
         """Save individual draft for review."""
+        tldr_lines = NL.join(f"- {t}" for t in draft.tldr)
+        reading_lines = NL.join(f"- [{fr.title}]({fr.url})" for fr in draft.further_reading or [])
         draft_content = f"""# {draft.title}
 
 *{draft.dek}*
 
 ## TL;DR
-{chr(10).join([f"- {t}" for t in draft.tldr])}
+{tldr_lines}
 
 ## Body
 
@@ -153,109 +229,121 @@ class ComprehensiveComparison:
 {', '.join(draft.tags)}
 
 ## Further Reading
-{chr(10).join([f"- [{fr.title}]({fr.url})" for fr in draft.further_reading or []])}
+{reading_lines}
 """
         
-        with open(self.output_dir / f"{name}_draft.md", 'w', encoding='utf-8') as f:
-            f.write(draft_content)
+        (self.output_dir / f"{name}_draft.md").write_text(draft_content, encoding='utf-8')
     
     def _generate_comprehensive_report(self, results: Dict[str, Any]) -> Path:
         """Generate comprehensive comparison report."""
-        report = "# Comprehensive Summarizer Comparison Report\n\n"
-        report += f"## Overview\n\n"
-        report += f"Tested {len(self.summarizers)} different summarization approaches on the same conversation.\n\n"
-        
-        # Summary table
-        report += "## Summary Table\n\n"
-        report += "| Summarizer | Word Count | Quality | Title |\n"
-        report += "|------------|------------|---------|-------|\n"
-        
-        for name, data in results.items():
-            if "error" not in data:
-                report += f"| {name} | {data['word_count']} | {data['overall_quality']} | {data['title'][:50]}... |\n"
-            else:
-                report += f"| {name} | ERROR | - | - |\n"
-        
-        report += "\n"
-        
-        # Detailed analysis
-        report += "## Detailed Analysis\n\n"
-        
-        for name, data in results.items():
-            if "error" not in data:
-                report += f"### {name.title()}\n\n"
-                report += f"**Title:** {data['title']}\n\n"
-                report += f"**Dek:** {data['dek']}\n\n"
-                report += f"**Word Count:** {data['word_count']}\n\n"
-                report += f"**Overall Quality:** {data['overall_quality']}\n\n"
-                
-                # Quality metrics
-                metrics = data['quality_metrics']
-                report += "**Quality Metrics:**\n"
-                report += f"- Narrative Flow: {'✅' if metrics['has_narrative_flow'] else '❌'}\n"
-                report += f"- Technical Details: {'✅' if metrics['has_technical_details'] else '❌'}\n"
-                report += f"- Personal Voice: {'✅' if metrics['has_personal_voice'] else '❌'}\n"
-                report += f"- Structure: {'✅' if metrics['has_structure'] else '❌'}\n"
-                report += f"- Style Appropriate: {'✅' if metrics['style_appropriate'] else '❌'}\n\n"
-                
-                # TL;DR
-                report += "**TL;DR:**\n"
-                for tldr in data['tldr']:
-                    report += f"- {tldr}\n"
-                report += "\n"
+        report_path = self.output_dir / "comprehensive_comparison_report.md"
+        with open(report_path, 'w', encoding='utf-8') as f:
+            w = f.write
+            w("# Comprehensive Summarizer Comparison Report\n\n")
+            w(f"## Overview\n\n")
+            w(f"Tested {len(self.summarizers)} different summarization approaches on the same conversation.\n\n")
+            
+            # Summary table
+            w("## Summary Table\n\n")
+            w("| Summarizer | Word Count | Quality | Title |\n")
+            w("|------------|------------|---------|-------|\n")
+            
+            for name, data in results.items():
+                if "error" not in data:
+                    w(f"| {name} | {data['word_count']} | {data['overall_quality']} | {data['title'][:50]}... |\n")
+                else:
+                    w(f"| {name} | ERROR | - | - |\n")
+            
+            w("\n")
+            
+            # Detailed analysis
+            w("## Detailed Analysis\n\n")
+            
+            for name, data in results.items():
+                if "error" not in data:
+                    w(f"### {name.title()}\n\n")
+                    w(f"**Title:** {data['title']}\n\n")
+                    w(f"**Dek:** {data['dek']}\n\n")
+                    w(f"**Word Count:** {data['word_count']}\n\n")
+                    w(f"**Overall Quality:** {data['overall_quality']}\n\n")
+                    
+                    # Quality metrics
+                    metrics = data['quality_metrics']
+                    w("**Quality Metrics:**\n")
+                    w(f"- Narrative Flow: {'✅' if metrics['has_narrative_flow'] else '❌'}\n")
+                    w(f"- Technical Details: {'✅' if metrics['has_technical_details'] else '❌'}\n")
+                    w(f"- Personal Voice: {'✅' if metrics['has_personal_voice'] else '❌'}\n")
+                    w(f"- Structure: {'✅' if metrics['has_structure'] else '❌'}\n")
+                    w(f"- Style Appropriate: {'✅' if metrics['style_appropriate'] else '❌'}\n\n")
+                    
+                    # TL;DR
+                    w("**TL;DR:**\n")
+                    for tldr in data['tldr']:
+                        w(f"- {tldr}\n")
+                    w("\n")
+                    
+                    # Tags
+                    w(f"**Tags:** {', '.join(data['tags'])}\n\n")
+                    
+                else:
+                    w(f"### {name.title()}\n\n")
+                    w(f"**Error:** {data['error']}\n\n")
+            
+            # Recommendations
+            w("## Recommendations\n\n")
+            
+            # Find best performers
+            successful_results = {k: v for k, v in results.items() if "error" not in v}
+            if successful_results:
+                best_quality = max(successful_results.items(), key=lambda x: x[1]['quality_metrics']['overall_quality'])
+                best_word_count = max(successful_results.items(), key=lambda x: x[1]['word_count'])
                 
-                # Tags
-                report += f"**Tags:** {', '.join(data['tags'])}\n\n"
+                w(f"**Best Overall Quality:** {best_quality[0]} ({best_quality[1]['overall_quality']})\n\n")
+                w(f"**Most Comprehensive:** {best_word_count[0]} ({best_word_count[1]['word_count']} words)\n\n")
                 
-            else:
-                report += f"### {name.title()}\n\n"
-                report += f"**Error:** {data['error']}\n\n"
-        
-        # Recommendations
-        report += "## Recommendations\n\n"
-        
-        # Find best performers
-        successful_results = {k: v for k, v in results.items() if "error" not in v}
-        if successful_results:
-            best_quality = max(successful_results.items(), key=lambda x: x[1]['quality_metrics']['overall_quality'])
-            best_word_count = max(successful_results.items(), key=lambda x: x[1]['word_count'])
-            
-            report += f"**Best Overall Quality:** {best_quality[0]} ({best_quality[1]['overall_quality']})\n\n"
-            report += f"**Most Comprehensive:** {best_word_count[0]} ({best_word_count[1]['word_count']} words)\n\n"
+                # Style-specific recommendations
+                w("**Style-Specific Recommendations:**\n")
+                w("- For technical project discussions: Use `technical_journal`\n")
+                w("- For research and analysis: Use `research_article`\n")
+                w("- For critiques and opinions: Use `critique`\n")
+                w("- For personal journal entries: Use `journal`\n")
+                w("- For narrative storytelling: Use `narrative`\n\n")
             
-            # Style-specific recommendations
-            report += "**Style-Specific Recommendations:**\n"
-            report += "- For technical project discussions: Use `technical_journal`\n"
-            report += "- For research and analysis: Use `research_article`\n"
-            report += "- For critiques and opinions: Use `critique`\n"
-            report += "- For personal journal entries: Use `journal`\n"
-            report += "- For narrative storytelling: Use `narrative`\n\n"
-        
-        report += "## Conclusion\n\n"
-        report += "This comparison demonstrates the importance of using the right summarizer for the right content type. "
-        report += "Each summarizer has its strengths and is optimized for specific use cases. "
-        report += "The specialized summarizers (technical_journal, research_article, critique) provide the most appropriate content structure for their respective domains.\n"
-        
-        # Save report
-        report_path = self.output_dir / "comprehensive_comparison_report.md"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report)
+            w("## Conclusion\n\n")
+            w("This comparison demonstrates the importance of using the right summarizer for the right content type. ")
+            w("Each summarizer has its strengths and is optimized for specific use cases. ")
+            w("The specialized summarizers (technical_journal, research_article, critique) provide the most appropriate content structure for their respective domains.\n")
         
         return report_path
     
     def _generate_summary_statistics(self, results: Dict[str, Any]):
         """Generate summary statistics JSON file."""
+        successful = 0
+        failed = 0
+        word_counts = {}
+        quality_ratings = {}
+        total_words = 0
+        
+        for name, data in results.items():
+            if "error" in data:
+                failed += 1
+                continue
+            successful += 1
+            word_count = data.get('word_count', 0)
+            word_counts[name] = word_count
+            quality_ratings[name] = data.get('overall_quality', 'Unknown')
+            total_words += word_count
+        
         stats = {
             "total_summarizers": len(self.summarizers),
-            "successful_summarizers": len([r for r in results.values() if "error" not in r]),
-            "failed_summarizers": len([r for r in results.values() if "error" in r]),
-            "word_counts": {name: data.get('word_count', 0) for name, data in results.items() if "error" not in data},
-            "quality_ratings": {name: data.get('overall_quality', 'Unknown') for name, data in results.items() if "error" not in data},
-            "average_word_count": sum(data.get('word_count', 0) for data in results.values() if "error" not in data) / max(1, len([r for r in results.values() if "error" not in r]))
+            "successful_summarizers": successful,
+            "failed_summarizers": failed,
+            "word_counts": word_counts,
+            "quality_ratings": quality_ratings,
+            "average_word_count": total_words / max(1, successful)
         }
         
-        with open(self.output_dir / "summary_statistics.json", 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2)
+        (self.output_dir / "summary_statistics.json").write_text(json.dumps(stats, indent=2), encoding='utf-8')
 
 
 def run_comprehensive_comparison(conversation: NormalizedConversation, output_dir: Path = Path("dist/comparison")) -> Path:
@@ -1,12 +1,178 @@
 """Comprehensive summarizer that captures much more content from conversations."""
 
 import re
-from typing import Dict, List, Any, Optional
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing.context import BaseContext
+from typing import Dict, Iterable, List, Any, Optional
 from ..util.schema import NormalizedConversation, SubstackDraft, FurtherReading
+from ..util.keywords import KeywordMatcher
 from .advanced_topic_extractor import extract_topics_advanced, extract_conversation_themes
 from ..analysis.signal_extractor import extract_content_signals, extract_high_confidence_signals
 
 
+# Patterns used by the extractors, compiled once at import time
+SOLUTION_PATTERNS = [
+    re.compile(r'here\'s (?:how|what|why)', re.IGNORECASE),
+    re.compile(r'you can (?:try|do|use)', re.IGNORECASE),
+    re.compile(r'try (?:this|that|using)', re.IGNORECASE),
+    re.compile(r'use (?:this|that|the following)', re.IGNORECASE),
+    re.compile(r'run (?:this|that|the following)', re.IGNORECASE),
+    re.compile(r'install (?:this|that|the following)', re.IGNORECASE),
+    re.compile(r'configure (?:this|that|the following)', re.IGNORECASE),
+]
+CODE_BLOCK_PATTERN = re.compile(r'```(?:python|bash|yaml|json|javascript|shell)?\n(.*?)\n```', re.DOTALL)
+INLINE_CODE_PATTERN = re.compile(r'`([^`]+)`')
+COMMAND_PATTERN = re.compile(r'(?:pip|npm|git|curl|ollama|litellm|python|bash)\s+[^\n]+')
+BRACKET_CHARS = frozenset('{}[]()')
+PUNCTUATION_CHARS = frozenset('.,;:!?')
+MEANINGFUL_CODE_PATTERN = re.compile(
+    'install|run|execute|create|build|setup|configure|deploy|test|verify'
+    '|import|from|def|class|function|if|for|while|try|except|return|yield',
+    re.IGNORECASE
+)
+MEANINGFUL_COMMAND_PATTERN = re.compile(
+    r'install\s+\w+'     # Installation commands
+    r'|run\s+\w+'        # Run commands
+    r'|create\s+\w+'     # Create commands
+    r'|build\s+\w+'      # Build commands
+    r'|setup\s+\w+'      # Setup commands
+    r'|configure\s+\w+'  # Configure commands
+    r'|deploy\s+\w+'     # Deploy commands
+    r'|test\s+\w+',      # Test commands
+    re.IGNORECASE
+)
+SENTENCE_PATTERN = re.compile(r'[^.!?]+[.!?]?')
+TERMINATED_SENTENCE_PATTERN = re.compile(r'[^.!?]+[.!?]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+HEDGE_PREFIX_PATTERN = re.compile(r'^(i think|i believe|i feel|i know|i understand|i realized|i learned)\s+', re.IGNORECASE)
+TRAILING_PUNCTUATION_PATTERN = re.compile(r'[.!?]+$')
+
+
+def _indicator_pattern(indicators: List[str]) -> re.Pattern:
+    """Compile a list of literal indicator phrases into one case-insensitive alternation."""
+    return re.compile('|'.join(map(re.escape, indicators)), re.IGNORECASE)
+
+
+# Project names in priority order; the first one present names the project
+PROJECT_NAMES = (
+    'sentry', 'testsentry', 'docsentry', 'litellm', 'ollama',
+    'deepseek', 'codestral', 'qwen', 'llama'
+)
+
+# Vocabularies scanned in a single pass each
+TECH_TERMS = (
+    'python', 'javascript', 'typescript', 'bash', 'shell', 'yaml', 'json',
+    'ollama', 'litellm', 'sentry', 'pytest', 'github', 'git', 'docker',
+    'kubernetes', 'aws', 'azure', 'gcp', 'api', 'rest', 'graphql',
+    'llama', 'deepseek', 'qwen', 'codestral', 'mistral', 'openai',
+    'rtx', 'gpu', 'vram', 'm1', 'macos', 'linux', 'windows',
+    'pip', 'npm', 'yarn', 'homebrew', 'conda', 'venv', 'virtualenv',
+    'pytest', 'unittest', 'coverage', 'black', 'flake8', 'mypy',
+    'github actions', 'ci/cd', 'workflow', 'runner', 'self-hosted'
+)
+TOOL_NAMES = (
+    'ollama', 'litellm', 'github', 'cursor', 'pytest', 'git',
+    'docker', 'homebrew', 'pipx', 'curl', 'jq', 'make',
+    'bash', 'shell', 'terminal', 'cli', 'api', 'web'
+)
+TECH_MATCHER = KeywordMatcher(TECH_TERMS)
+TOOL_MATCHER = KeywordMatcher(TOOL_NAMES)
+
+
+# Indicator phrases for each extractor, matched as case-insensitive substrings
+PROBLEM_PATTERN = _indicator_pattern([
+    'need to', 'want to', 'trying to', 'looking for', 'problem', 'issue',
+    'challenge', 'considering', 'thinking about', 'working on', 'wondering',
+    'unsure', 'confused', 'stuck', 'help with'
+])
+SOLUTION_INDICATOR_PATTERN = _indicator_pattern([
+    'solution', 'answer', 'here\'s how', 'you can', 'try this',
+    'recommend', 'suggest', 'approach', 'method', 'way to',
+    'here\'s what', 'let me', 'i\'ll help', 'we can'
+])
+IMPLEMENTATION_PATTERN = _indicator_pattern([
+    'step', 'first', 'then', 'next', 'after', 'now', 'finally',
+    'install', 'run', 'execute', 'create', 'build', 'setup',
+    'configure', 'deploy', 'test', 'verify'
+])
+CHALLENGE_PATTERN = _indicator_pattern([
+    'challenge', 'problem', 'issue', 'difficult', 'trouble',
+    'error', 'bug', 'obstacle', 'timeout', 'memory', 'performance',
+    'dns', 'network', 'connection', 'failed', 'stuck', 'blocked'
+])
+DECISION_PATTERN = _indicator_pattern([
+    'decided to', 'chose to', 'opted for', 'went with', 'selected',
+    'recommend', 'suggest', 'prefer', 'better to', 'best to',
+    'should use', 'should go with', 'would recommend'
+])
+RESULT_PATTERN = _indicator_pattern([
+    'success', 'working', 'completed', 'finished', 'achieved',
+    'done', 'resolved', 'fixed', 'implemented', 'deployed',
+    'running', 'functional', 'operational', 'ready'
+])
+LESSON_PATTERN = _indicator_pattern([
+    'learned', 'realized', 'discovered', 'found out', 'understood',
+    'important', 'key insight', 'takeaway', 'lesson', 'remember',
+    'note that', 'keep in mind', 'crucial', 'essential'
+])
+NEXT_STEP_PATTERN = _indicator_pattern([
+    'next step', 'next', 'then', 'after', 'later', 'future',
+    'plan to', 'going to', 'will', 'should', 'need to',
+    'want to', 'thinking about', 'considering'
+])
+INSIGHT_PATTERN = _indicator_pattern([
+    'insight', 'important', 'key point', 'note that', 'remember',
+    'crucial', 'essential', 'significant', 'notable', 'interesting',
+    'worth noting', 'keep in mind', 'pay attention to'
+])
+ARCHITECTURE_PATTERN = _indicator_pattern([
+    'architecture', 'design', 'structure', 'approach', 'pattern',
+    'framework', 'platform', 'system', 'infrastructure', 'setup',
+    'configuration', 'deployment', 'environment'
+])
+
+
+@lru_cache(maxsize=4096)
+def _clean_text(text: str) -> str:
+    """Clean and format text, cached since the same sentence often feeds several extractors."""
+    # Remove extra whitespace
+    text = WHITESPACE_PATTERN.sub(' ', text)
+    # Remove common prefixes
+    text = HEDGE_PREFIX_PATTERN.sub('', text)
+    # Remove trailing punctuation
+    text = TRAILING_PUNCTUATION_PATTERN.sub('', text)
+    return text.strip()
+
+
+# Sentence-level assistant extractors as (context key, indicator pattern,
+# minimum message length, minimum sentence length)
+SENTENCE_EXTRACTORS = [
+    ('implementation_details', IMPLEMENTATION_PATTERN, 100, 20),
+    ('decisions_made', DECISION_PATTERN, 100, 30),
+    ('results_achieved', RESULT_PATTERN, 100, 20),
+    ('lessons_learned', LESSON_PATTERN, 100, 30),
+    ('key_insights', INSIGHT_PATTERN, 150, 40),
+    ('architecture_decisions', ARCHITECTURE_PATTERN, 150, 40),
+]
+
+# Maximum number of items kept per extracted context list
+CONTEXT_CAPS = {
+    'problem_evolution': 8,
+    'solution_journey': 10,
+    'implementation_details': 15,
+    'challenges_timeline': 10,
+    'solutions_provided': 12,
+    'decisions_made': 8,
+    'results_achieved': 8,
+    'lessons_learned': 10,
+    'next_steps': 8,
+    'key_insights': 10,
+    'architecture_decisions': 8,
+}
+
+
 class ComprehensiveTechnicalJournalSummarizer:
     """Comprehensive summarizer that captures much more content from technical conversations."""
     
@@ -15,9 +181,17 @@ class ComprehensiveTechnicalJournalSummarizer:
     
     def extract_comprehensive_context(self, conversation: NormalizedConversation) -> Dict[str, Any]:
         """Extract comprehensive context from the entire conversation."""
-        user_messages = [msg.text for msg in conversation.messages if msg.role == "user"]
-        assistant_messages = [msg.text for msg in conversation.messages if msg.role == "assistant"]
-        all_text = " ".join([msg.text for msg in conversation.messages])
+        user_messages = []
+        assistant_messages = []
+        texts = []
+        for msg in conversation.messages:
+            texts.append(msg.text)
+            if msg.role == "user":
+                user_messages.append(msg.text)
+            elif msg.role == "assistant":
+                assistant_messages.append(msg.text)
+        all_text = " ".join(texts)
+        all_text_lower = all_text.lower()
         
         # Extract advanced topics
         topic_analysis = extract_topics_advanced(all_text)
@@ -27,22 +201,26 @@ class ComprehensiveTechnicalJournalSummarizer:
         all_signals = extract_content_signals(all_text)
         high_confidence_signals = extract_high_confidence_signals(all_text, min_confidence=0.7)
         
+        # Message extractors, fused into one pass per role
+        user_context = self._extract_user_context(user_messages)
+        assistant_context = self._extract_assistant_context(assistant_messages)
+        
         return {
-            'project_name': self._extract_project_name(all_text),
-            'problem_evolution': self._extract_problem_evolution(user_messages),
-            'solution_journey': self._extract_solution_journey(assistant_messages),
-            'implementation_details': self._extract_detailed_implementation(assistant_messages),
-            'technical_stack': self._extract_comprehensive_tech_stack(all_text),
-            'challenges_timeline': self._extract_challenges_timeline(assistant_messages),
-            'solutions_provided': self._extract_all_solutions(assistant_messages),
+            'project_name': self._extract_project_name(all_text_lower),
+            'problem_evolution': user_context['problem_evolution'],
+            'solution_journey': assistant_context['solution_journey'],
+            'implementation_details': assistant_context['implementation_details'],
+            'technical_stack': self._extract_comprehensive_tech_stack(all_text_lower),
+            'challenges_timeline': assistant_context['challenges_timeline'],
+            'solutions_provided': assistant_context['solutions_provided'],
             'code_examples': self._extract_meaningful_code_examples(all_text),
-            'decisions_made': self._extract_decisions_made(assistant_messages),
-            'results_achieved': self._extract_results_achieved(assistant_messages),
-            'lessons_learned': self._extract_comprehensive_lessons(assistant_messages),
-            'next_steps': self._extract_next_steps(user_messages),
-            'key_insights': self._extract_key_insights(assistant_messages),
-            'tools_used': self._extract_all_tools_used(all_text),
-            'architecture_decisions': self._extract_architecture_decisions(assistant_messages),
+            'decisions_made': assistant_context['decisions_made'],
+            'results_achieved': assistant_context['results_achieved'],
+            'lessons_learned': assistant_context['lessons_learned'],
+            'next_steps': user_context['next_steps'],
+            'key_insights': assistant_context['key_insights'],
+            'tools_used': self._extract_all_tools_used(all_text_lower),
+            'architecture_decisions': assistant_context['architecture_decisions'],
             'topics_discussed': topic_analysis['primary_topics'],
             'conversation_themes': conversation_themes,
             'domain_breakdown': topic_analysis['domain_breakdown'],
@@ -52,169 +230,148 @@ class ComprehensiveTechnicalJournalSummarizer:
             'signal_summary': {
                 'total_signals': len(all_signals),
                 'high_confidence_count': len(high_confidence_signals),
-                'signal_types': {signal_type: len([s for s in all_signals if s.signal_type == signal_type]) 
-                               for signal_type in set(s.signal_type for s in all_signals)}
+                'signal_types': dict(Counter(s.signal_type for s in all_signals))
             }
         }
     
-    def _extract_project_name(self, text: str) -> str:
-        """Extract the project name from the conversation."""
-        project_patterns = [
-            r'sentry', r'testsentry', r'docsentry', r'litellm', r'ollama',
-            r'deepseek', r'codestral', r'qwen', r'llama'
-        ]
-        
-        for pattern in project_patterns:
-            if pattern in text.lower():
-                return pattern.title()
+    def _extract_project_name(self, text_lower: str) -> str:
+        """Extract the project name from the lowercased conversation text."""
+        # Only the highest-priority name matters, so stop at the first hit
+        for name in PROJECT_NAMES:
+            if name in text_lower:
+                return name.title()
         
         return "Technical Project"
     
-    def _extract_problem_evolution(self, user_messages: List[str]) -> List[str]:
-        """Extract how the problem evolved throughout the conversation."""
+    def _extract_user_context(self, user_messages: List[str]) -> Dict[str, List[str]]:
+        """Extract the problem evolution and next steps in one pass over the user messages."""
         problems = []
+        next_steps = []
+        
+        max_problems = CONTEXT_CAPS['problem_evolution']
+        max_next_steps = CONTEXT_CAPS['next_steps']
         
         for i, message in enumerate(user_messages):
-            if len(message) > 30:
-                # Look for problem indicators
-                problem_indicators = [
-                    'need to', 'want to', 'trying to', 'looking for', 'problem', 'issue',
-                    'challenge', 'considering', 'thinking about', 'working on', 'wondering',
-                    'unsure', 'confused', 'stuck', 'help with'
-                ]
-                if any(indicator in message.lower() for indicator in problem_indicators):
-                    problems.append(f"Step {i+1}: {self._clean_text(message)}")
-        
-        return problems[:8]
-    
-    def _extract_solution_journey(self, assistant_messages: List[str]) -> List[str]:
-        """Extract the journey of solutions provided."""
-        solutions = []
+            if len(problems) >= max_problems and len(next_steps) >= max_next_steps:
+                break
+            if len(message) <= 30:
+                continue
+            if len(problems) < max_problems and PROBLEM_PATTERN.search(message):
+                problems.append(f"Step {i+1}: {self._clean_text(message)}")
+            if len(next_steps) < max_next_steps and NEXT_STEP_PATTERN.search(message):
+                next_steps.append(self._clean_text(message))
         
-        for i, message in enumerate(assistant_messages):
-            if len(message) > 50:
-                # Look for solution indicators
-                solution_indicators = [
-                    'solution', 'answer', 'here\'s how', 'you can', 'try this',
-                    'recommend', 'suggest', 'approach', 'method', 'way to',
-                    'here\'s what', 'let me', 'i\'ll help', 'we can'
-                ]
-                if any(indicator in message.lower() for indicator in solution_indicators):
-                    solutions.append(f"Solution {i+1}: {self._clean_text(message[:200])}")
-        
-        return solutions[:10]
-    
-    def _extract_detailed_implementation(self, assistant_messages: List[str]) -> List[str]:
-        """Extract detailed implementation steps."""
-        implementation = []
-        
-        for message in assistant_messages:
-            if len(message) > 100:
-                # Look for implementation indicators
-                impl_indicators = [
-                    'step', 'first', 'then', 'next', 'after', 'now', 'finally',
-                    'install', 'run', 'execute', 'create', 'build', 'setup',
-                    'configure', 'deploy', 'test', 'verify'
-                ]
-                if any(indicator in message.lower() for indicator in impl_indicators):
-                    # Extract the implementation details
-                    sentences = message.split('.')
-                    for sentence in sentences:
-                        if any(indicator in sentence.lower() for indicator in impl_indicators):
-                            if len(sentence.strip()) > 20:
-                                implementation.append(self._clean_text(sentence.strip()))
-        
-        return implementation[:15]
+        return {
+            'problem_evolution': problems,
+            'next_steps': next_steps,
+        }
     
-    def _extract_comprehensive_tech_stack(self, text: str) -> List[str]:
-        """Extract comprehensive technical stack."""
-        tech_terms = [
-            'python', 'javascript', 'typescript', 'bash', 'shell', 'yaml', 'json',
-            'ollama', 'litellm', 'sentry', 'pytest', 'github', 'git', 'docker',
-            'kubernetes', 'aws', 'azure', 'gcp', 'api', 'rest', 'graphql',
-            'llama', 'deepseek', 'qwen', 'codestral', 'mistral', 'openai',
-            'rtx', 'gpu', 'vram', 'm1', 'macos', 'linux', 'windows',
-            'pip', 'npm', 'yarn', 'homebrew', 'conda', 'venv', 'virtualenv',
-            'pytest', 'unittest', 'coverage', 'black', 'flake8', 'mypy',
-            'github actions', 'ci/cd', 'workflow', 'runner', 'self-hosted'
-        ]
+    def _extract_assistant_context(self, assistant_messages: List[str]) -> Dict[str, List[str]]:
+        """Run every assistant-message extractor in one pass over the assistant messages."""
+        buckets = {
+            'solution_journey': [],
+            'challenges_timeline': [],
+            'solutions_provided': [],
+        }
+        for bucket, _, _, _ in SENTENCE_EXTRACTORS:
+            buckets[bucket] = []
         
-        found_tech = []
-        for tech in tech_terms:
-            if tech.lower() in text.lower():
-                found_tech.append(tech.title())
+        def is_full(bucket: str) -> bool:
+            return len(buckets[bucket]) >= CONTEXT_CAPS[bucket]
         
-        return list(set(found_tech))
-    
-    def _extract_challenges_timeline(self, assistant_messages: List[str]) -> List[str]:
-        """Extract challenges encountered in chronological order."""
-        challenges = []
+        # Tiny conversations: no message is long enough for any extractor
+        if all(len(message) <= 50 for message in assistant_messages):
+            return buckets
         
         for i, message in enumerate(assistant_messages):
-            if len(message) > 50:
-                challenge_indicators = [
-                    'challenge', 'problem', 'issue', 'difficult', 'trouble',
-                    'error', 'bug', 'obstacle', 'timeout', 'memory', 'performance',
-                    'dns', 'network', 'connection', 'failed', 'stuck', 'blocked'
-                ]
-                if any(indicator in message.lower() for indicator in challenge_indicators):
-                    challenges.append(f"Challenge {i+1}: {self._clean_text(message[:150])}")
-        
-        return challenges[:10]
+            if all(is_full(bucket) for bucket in buckets):
+                break
+            if len(message) <= 50:
+                continue
+            
+            # Message-level extractors
+            if not is_full('solution_journey') and SOLUTION_INDICATOR_PATTERN.search(message):
+                buckets['solution_journey'].append(f"Solution {i+1}: {self._clean_text(message[:200])}")
+            if not is_full('challenges_timeline') and CHALLENGE_PATTERN.search(message):
+                buckets['challenges_timeline'].append(f"Challenge {i+1}: {self._clean_text(message[:150])}")
+            
+            if len(message) <= 100:
+                continue
+            if not is_full('solutions_provided'):
+                buckets['solutions_provided'].extend(self._extract_message_solutions(message))
+            
+            # Sentence-level extractors share one tokenization of the message
+            sentences = SENTENCE_PATTERN.findall(message)
+            for bucket, pattern, min_message_length, min_sentence_length in SENTENCE_EXTRACTORS:
+                if is_full(bucket) or len(message) <= min_message_length:
+                    continue
+                for sentence in sentences:
+                    if pattern.search(sentence) and len(sentence.strip()) > min_sentence_length:
+                        buckets[bucket].append(self._clean_text(sentence.strip()))
+                        if is_full(bucket):
+                            break
+        
+        return {bucket: items[:CONTEXT_CAPS[bucket]] for bucket, items in buckets.items()}
     
-    def _extract_all_solutions(self, assistant_messages: List[str]) -> List[str]:
-        """Extract all solutions provided."""
+    def _extract_message_solutions(self, message: str) -> List[str]:
+        """Extract the sentences of a message that contain a solution."""
         solutions = []
+        sentences = [sentence.strip() for sentence in TERMINATED_SENTENCE_PATTERN.findall(message)]
         
-        for message in assistant_messages:
-            if len(message) > 100:
-                # Look for solution patterns
-                solution_patterns = [
-                    r'here\'s (?:how|what|why)',
-                    r'you can (?:try|do|use)',
-                    r'try (?:this|that|using)',
-                    r'use (?:this|that|the following)',
-                    r'run (?:this|that|the following)',
-                    r'install (?:this|that|the following)',
-                    r'configure (?:this|that|the following)'
-                ]
-                
-                for pattern in solution_patterns:
-                    matches = re.findall(pattern, message, re.IGNORECASE)
-                    for match in matches:
-                        # Extract the sentence containing the solution
-                        sentence_match = re.search(r'[^.!?]*' + re.escape(match) + r'[^.!?]*[.!?]', message, re.IGNORECASE)
-                        if sentence_match:
-                            sentence = sentence_match.group(0).strip()
-                            if len(sentence) > 30:
-                                solutions.append(self._clean_text(sentence))
-        
-        return solutions[:12]
+        # Look for solution patterns in each complete sentence
+        for pattern in SOLUTION_PATTERNS:
+            for sentence in sentences:
+                if len(sentence) > 30 and pattern.search(sentence):
+                    solutions.append(self._clean_text(sentence))
+        
+        return solutions
+    
+    def _extract_comprehensive_tech_stack(self, text_lower: str) -> List[str]:
+        """Extract comprehensive technical stack from the lowercased conversation text."""
+        found = TECH_MATCHER.findall(text_lower)
+        
+        # dict.fromkeys de-duplicates while keeping vocabulary order
+        return list(dict.fromkeys(tech.title() for tech in TECH_TERMS if tech in found))
     
     def _extract_meaningful_code_examples(self, text: str) -> List[str]:
         """Extract only meaningful code examples that contribute to the story."""
         code_examples = []
+        max_examples = 8  # Reduced from 15 to 8 for more selective inclusion
+        
+        # Code blocks and inline code both need backticks; short chats rarely have any
+        if '`' not in text:
+            return self._extract_meaningful_commands(text, code_examples, max_examples)
         
         # Extract code blocks that are substantial and meaningful
-        code_blocks = re.findall(r'```(?:python|bash|yaml|json|javascript|shell)?\n(.*?)\n```', text, re.DOTALL)
-        for block in code_blocks:
-            block = block.strip()
+        for match in CODE_BLOCK_PATTERN.finditer(text):
+            block = match.group(1).strip()
             if len(block) > 20 and self._is_meaningful_code(block):
                 code_examples.append(block)
+                if len(code_examples) >= max_examples:
+                    return code_examples
         
         # Extract inline code that's substantial
-        inline_code = re.findall(r'`([^`]+)`', text)
-        for code in inline_code:
+        for match in INLINE_CODE_PATTERN.finditer(text):
+            code = match.group(1)
             if len(code) > 10 and len(code) < 100 and self._is_meaningful_code(code):
                 code_examples.append(code)
+                if len(code_examples) >= max_examples:
+                    return code_examples
         
-        # Extract important commands
-        commands = re.findall(r'(?:pip|npm|git|curl|ollama|litellm|python|bash)\s+[^\n]+', text)
-        for cmd in commands:
+        return self._extract_meaningful_commands(text, code_examples, max_examples)
+    
+    def _extract_meaningful_commands(
+        self, text: str, code_examples: List[str], max_examples: int
+    ) -> List[str]:
+        """Add important commands to the code examples found so far."""
+        for match in COMMAND_PATTERN.finditer(text):
+            cmd = match.group(0)
             if len(cmd) > 15 and self._is_meaningful_command(cmd):
                 code_examples.append(cmd)
+                if len(code_examples) >= max_examples:
+                    return code_examples
         
-        return code_examples[:8]  # Reduced from 15 to 8 for more selective inclusion
+        return code_examples
     
     def _is_meaningful_code(self, code: str) -> bool:
         """Determine if code is meaningful and contributes to the story."""
@@ -226,26 +383,17 @@ class ComprehensiveTechnicalJournalSummarizer:
         if len(code.split()) < 3:
             return False
         
-        # Skip common trivial patterns
-        trivial_patterns = [
-            r'^\w+$',  # Single word
-            r'^\d+$',  # Single number
-            r'^[{}[\]()]+$',  # Just brackets
-            r'^[.,;:!?]+$',  # Just punctuation
-        ]
-        
-        for pattern in trivial_patterns:
-            if re.match(pattern, code.strip()):
-                return False
+        # Skip common trivial patterns: a single word or number, or only
+        # brackets or punctuation
+        stripped = code.strip()
+        if stripped.replace('_', '').isalnum() or stripped.isdigit():
+            return False
+        chars = set(stripped)
+        if chars <= BRACKET_CHARS or chars <= PUNCTUATION_CHARS:
+            return False
         
         # Look for meaningful indicators
-        meaningful_indicators = [
-            'install', 'run', 'execute', 'create', 'build', 'setup', 'configure',
-            'deploy', 'test', 'verify', 'import', 'from', 'def', 'class', 'function',
-            'if', 'for', 'while', 'try', 'except', 'return', 'yield'
-        ]
-        
-        return any(indicator in code.lower() for indicator in meaningful_indicators)
+        return MEANINGFUL_CODE_PATTERN.search(code) is not None
     
     def _is_meaningful_command(self, cmd: str) -> bool:
         """Determine if a command is meaningful and contributes to the story."""
@@ -254,160 +402,18 @@ class ComprehensiveTechnicalJournalSummarizer:
             return False
         
         # Look for meaningful command patterns
-        meaningful_patterns = [
-            r'install\s+\w+',  # Installation commands
-            r'run\s+\w+',      # Run commands
-            r'create\s+\w+',   # Create commands
-            r'build\s+\w+',    # Build commands
-            r'setup\s+\w+',    # Setup commands
-            r'configure\s+\w+', # Configure commands
-            r'deploy\s+\w+',   # Deploy commands
-            r'test\s+\w+',     # Test commands
-        ]
-        
-        return any(re.search(pattern, cmd, re.IGNORECASE) for pattern in meaningful_patterns)
-    
-    def _extract_decisions_made(self, assistant_messages: List[str]) -> List[str]:
-        """Extract decisions made during the conversation."""
-        decisions = []
-        
-        for message in assistant_messages:
-            if len(message) > 100:
-                decision_indicators = [
-                    'decided to', 'chose to', 'opted for', 'went with', 'selected',
-                    'recommend', 'suggest', 'prefer', 'better to', 'best to',
-                    'should use', 'should go with', 'would recommend'
-                ]
-                if any(indicator in message.lower() for indicator in decision_indicators):
-                    sentences = message.split('.')
-                    for sentence in sentences:
-                        if any(indicator in sentence.lower() for indicator in decision_indicators):
-                            if len(sentence.strip()) > 30:
-                                decisions.append(self._clean_text(sentence.strip()))
-        
-        return decisions[:8]
-    
-    def _extract_results_achieved(self, assistant_messages: List[str]) -> List[str]:
-        """Extract results achieved."""
-        results = []
-        
-        for message in assistant_messages:
-            if len(message) > 100:
-                result_indicators = [
-                    'success', 'working', 'completed', 'finished', 'achieved',
-                    'done', 'resolved', 'fixed', 'implemented', 'deployed',
-                    'running', 'functional', 'operational', 'ready'
-                ]
-                if any(indicator in message.lower() for indicator in result_indicators):
-                    sentences = message.split('.')
-                    for sentence in sentences:
-                        if any(indicator in sentence.lower() for indicator in result_indicators):
-                            if len(sentence.strip()) > 20:
-                                results.append(self._clean_text(sentence.strip()))
-        
-        return results[:8]
+        return MEANINGFUL_COMMAND_PATTERN.search(cmd) is not None
     
-    def _extract_comprehensive_lessons(self, assistant_messages: List[str]) -> List[str]:
-        """Extract comprehensive lessons learned."""
-        lessons = []
-        
-        for message in assistant_messages:
-            if len(message) > 100:
-                lesson_indicators = [
-                    'learned', 'realized', 'discovered', 'found out', 'understood',
-                    'important', 'key insight', 'takeaway', 'lesson', 'remember',
-                    'note that', 'keep in mind', 'crucial', 'essential'
-                ]
-                if any(indicator in message.lower() for indicator in lesson_indicators):
-                    sentences = message.split('.')
-                    for sentence in sentences:
-                        if any(indicator in sentence.lower() for indicator in lesson_indicators):
-                            if len(sentence.strip()) > 30:
-                                lessons.append(self._clean_text(sentence.strip()))
-        
-        return lessons[:10]
-    
-    def _extract_next_steps(self, user_messages: List[str]) -> List[str]:
-        """Extract next steps mentioned by the user."""
-        next_steps = []
+    def _extract_all_tools_used(self, text_lower: str) -> List[str]:
+        """Extract all tools and utilities used from the lowercased conversation text."""
+        found = TOOL_MATCHER.findall(text_lower)
         
-        for message in user_messages:
-            if len(message) > 30:
-                next_step_indicators = [
-                    'next step', 'next', 'then', 'after', 'later', 'future',
-                    'plan to', 'going to', 'will', 'should', 'need to',
-                    'want to', 'thinking about', 'considering'
-                ]
-                if any(indicator in message.lower() for indicator in next_step_indicators):
-                    next_steps.append(self._clean_text(message))
-        
-        return next_steps[:8]
-    
-    def _extract_key_insights(self, assistant_messages: List[str]) -> List[str]:
-        """Extract key insights from the conversation."""
-        insights = []
-        
-        for message in assistant_messages:
-            if len(message) > 150:
-                insight_indicators = [
-                    'insight', 'important', 'key point', 'note that', 'remember',
-                    'crucial', 'essential', 'significant', 'notable', 'interesting',
-                    'worth noting', 'keep in mind', 'pay attention to'
-                ]
-                if any(indicator in message.lower() for indicator in insight_indicators):
-                    sentences = message.split('.')
-                    for sentence in sentences:
-                        if any(indicator in sentence.lower() for indicator in insight_indicators):
-                            if len(sentence.strip()) > 40:
-                                insights.append(self._clean_text(sentence.strip()))
-        
-        return insights[:10]
-    
-    def _extract_all_tools_used(self, text: str) -> List[str]:
-        """Extract all tools and utilities used."""
-        tools = []
-        
-        tool_patterns = [
-            r'ollama', r'litellm', r'github', r'cursor', r'pytest', r'git',
-            r'docker', r'homebrew', r'pipx', r'curl', r'jq', r'make',
-            r'bash', r'shell', r'terminal', r'cli', r'api', r'web'
-        ]
-        
-        for pattern in tool_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                tools.append(pattern.title())
-        
-        return list(set(tools))
-    
-    def _extract_architecture_decisions(self, assistant_messages: List[str]) -> List[str]:
-        """Extract architecture decisions made."""
-        decisions = []
-        
-        for message in assistant_messages:
-            if len(message) > 150:
-                arch_indicators = [
-                    'architecture', 'design', 'structure', 'approach', 'pattern',
-                    'framework', 'platform', 'system', 'infrastructure', 'setup',
-                    'configuration', 'deployment', 'environment'
-                ]
-                if any(indicator in message.lower() for indicator in arch_indicators):
-                    sentences = message.split('.')
-                    for sentence in sentences:
-                        if any(indicator in sentence.lower() for indicator in arch_indicators):
-                            if len(sentence.strip()) > 40:
-                                decisions.append(self._clean_text(sentence.strip()))
-        
-        return decisions[:8]
+        # dict.fromkeys de-duplicates while keeping vocabulary order
+        return list(dict.fromkeys(name.title() for name in TOOL_NAMES if name in found))
     
     def _clean_text(self, text: str) -> str:
         """Clean and format text."""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove common prefixes
-        text = re.sub(r'^(i think|i believe|i feel|i know|i understand|i realized|i learned)\s+', '', text, flags=re.IGNORECASE)
-        # Remove trailing punctuation
-        text = re.sub(r'[.!?]+$', '', text)
-        return text.strip()
+        return _clean_text(text)
     
     def create_comprehensive_title(self, conversation: NormalizedConversation, context: Dict[str, Any]) -> str:
         """Create a comprehensive title."""
@@ -457,176 +463,121 @@ class ComprehensiveTechnicalJournalSummarizer:
     
     def create_comprehensive_body(self, conversation: NormalizedConversation, context: Dict[str, Any]) -> str:
         """Create a comprehensive technical journal body."""
-        body_parts = []
-        
-        # Introduction
-        body_parts.append("## The Complete Development Journey")
-        body_parts.append("")
-        body_parts.append(f"This comprehensive technical journal documents the complete development process of {context['project_name']}, capturing every challenge, solution, and insight from the entire conversation.")
-        body_parts.append("")
+        # Each section heading and intro is a single block; items are added with extend
+        body_parts = [
+            "## The Complete Development Journey\n",
+            f"This comprehensive technical journal documents the complete development process of {context['project_name']}, capturing every challenge, solution, and insight from the entire conversation.",
+            "",
+        ]
         
         # Topics and Themes
         if context['topics_discussed']:
-            body_parts.append("## Topics and Themes Discussed")
-            body_parts.append("")
-            body_parts.append("The conversation covered several key topics and themes:")
-            body_parts.append("")
-            for i, topic in enumerate(context['topics_discussed'][:8], 1):
-                body_parts.append(f"{i}. {topic}")
+            body_parts.append("## Topics and Themes Discussed\n\nThe conversation covered several key topics and themes:\n")
+            body_parts.extend(f"{i}. {topic}" for i, topic in enumerate(context['topics_discussed'][:8], 1))
             body_parts.append("")
         
         if context['conversation_themes']:
-            body_parts.append("## Main Themes")
-            body_parts.append("")
-            for theme in context['conversation_themes']:
-                body_parts.append(f"- {theme}")
+            body_parts.append("## Main Themes\n")
+            body_parts.extend(f"- {theme}" for theme in context['conversation_themes'])
             body_parts.append("")
         
         # Problem Evolution
         if context['problem_evolution']:
-            body_parts.append("## Problem Evolution")
-            body_parts.append("")
-            body_parts.append("The problem evolved throughout the conversation as new challenges emerged:")
-            body_parts.append("")
-            for i, problem in enumerate(context['problem_evolution'], 1):
-                body_parts.append(f"{i}. {problem}")
+            body_parts.append("## Problem Evolution\n\nThe problem evolved throughout the conversation as new challenges emerged:\n")
+            body_parts.extend(f"{i}. {problem}" for i, problem in enumerate(context['problem_evolution'], 1))
             body_parts.append("")
         
         # Solution Journey
         if context['solution_journey']:
-            body_parts.append("## Solution Journey")
-            body_parts.append("")
-            body_parts.append("The solutions were developed iteratively:")
-            body_parts.append("")
-            for i, solution in enumerate(context['solution_journey'], 1):
-                body_parts.append(f"{i}. {solution}")
+            body_parts.append("## Solution Journey\n\nThe solutions were developed iteratively:\n")
+            body_parts.extend(f"{i}. {solution}" for i, solution in enumerate(context['solution_journey'], 1))
             body_parts.append("")
         
         # Technical Stack
         if context['technical_stack']:
-            body_parts.append("## Comprehensive Technical Stack")
-            body_parts.append("")
-            body_parts.append("The project utilized a wide range of technologies:")
-            body_parts.append("")
-            for tech in context['technical_stack']:
-                body_parts.append(f"- **{tech}**: [Description of usage]")
+            body_parts.append("## Comprehensive Technical Stack\n\nThe project utilized a wide range of technologies:\n")
+            body_parts.extend(f"- **{tech}**: [Description of usage]" for tech in context['technical_stack'])
             body_parts.append("")
         
         # Implementation Details
         if context['implementation_details']:
-            body_parts.append("## Detailed Implementation")
-            body_parts.append("")
-            body_parts.append("The implementation involved numerous detailed steps:")
-            body_parts.append("")
-            for i, detail in enumerate(context['implementation_details'], 1):
-                body_parts.append(f"{i}. {detail}")
+            body_parts.append("## Detailed Implementation\n\nThe implementation involved numerous detailed steps:\n")
+            body_parts.extend(f"{i}. {detail}" for i, detail in enumerate(context['implementation_details'], 1))
             body_parts.append("")
         
         # Challenges Timeline
         if context['challenges_timeline']:
-            body_parts.append("## Challenges Encountered")
-            body_parts.append("")
-            body_parts.append("Several challenges were encountered and overcome:")
-            body_parts.append("")
-            for challenge in context['challenges_timeline']:
-                body_parts.append(f"- {challenge}")
+            body_parts.append("## Challenges Encountered\n\nSeveral challenges were encountered and overcome:\n")
+            body_parts.extend(f"- {challenge}" for challenge in context['challenges_timeline'])
             body_parts.append("")
         
         # Solutions Provided
         if context['solutions_provided']:
-            body_parts.append("## Solutions Provided")
-            body_parts.append("")
-            body_parts.append("Multiple solutions were developed and implemented:")
-            body_parts.append("")
-            for i, solution in enumerate(context['solutions_provided'], 1):
-                body_parts.append(f"{i}. {solution}")
+            body_parts.append("## Solutions Provided\n\nMultiple solutions were developed and implemented:\n")
+            body_parts.extend(f"{i}. {solution}" for i, solution in enumerate(context['solutions_provided'], 1))
             body_parts.append("")
         
         # Code Examples
         if context['code_examples']:
-            body_parts.append("## Code Examples")
-            body_parts.append("")
-            body_parts.append("Key code examples from the implementation:")
-            body_parts.append("")
-            for i, example in enumerate(context['code_examples'][:8], 1):
-                body_parts.append(f"**Example {i}:**")
-                body_parts.append("```")
-                body_parts.append(example)
-                body_parts.append("```")
-                body_parts.append("")
+            body_parts.append("## Code Examples\n\nKey code examples from the implementation:\n")
+            body_parts.extend(
+                f"**Example {i}:**\n```\n{example}\n```\n"
+                for i, example in enumerate(context['code_examples'][:8], 1)
+            )
         
         # Architecture Decisions
         if context['architecture_decisions']:
-            body_parts.append("## Architecture Decisions")
-            body_parts.append("")
-            body_parts.append("Key architectural decisions made during development:")
-            body_parts.append("")
-            for decision in context['architecture_decisions']:
-                body_parts.append(f"- {decision}")
+            body_parts.append("## Architecture Decisions\n\nKey architectural decisions made during development:\n")
+            body_parts.extend(f"- {decision}" for decision in context['architecture_decisions'])
             body_parts.append("")
         
         # Results Achieved
         if context['results_achieved']:
-            body_parts.append("## Results Achieved")
-            body_parts.append("")
-            body_parts.append("The project achieved several key results:")
-            body_parts.append("")
-            for result in context['results_achieved']:
-                body_parts.append(f"- {result}")
+            body_parts.append("## Results Achieved\n\nThe project achieved several key results:\n")
+            body_parts.extend(f"- {result}" for result in context['results_achieved'])
             body_parts.append("")
         
         # Key Insights
         if context['key_insights']:
-            body_parts.append("## Key Insights")
-            body_parts.append("")
-            body_parts.append("Important insights gained during the development process:")
-            body_parts.append("")
-            for insight in context['key_insights']:
-                body_parts.append(f"- {insight}")
+            body_parts.append("## Key Insights\n\nImportant insights gained during the development process:\n")
+            body_parts.extend(f"- {insight}" for insight in context['key_insights'])
             body_parts.append("")
         
         # Lessons Learned
         if context['lessons_learned']:
-            body_parts.append("## Comprehensive Lessons Learned")
-            body_parts.append("")
-            body_parts.append("The development process provided numerous valuable lessons:")
-            body_parts.append("")
-            for lesson in context['lessons_learned']:
-                body_parts.append(f"- {lesson}")
+            body_parts.append("## Comprehensive Lessons Learned\n\nThe development process provided numerous valuable lessons:\n")
+            body_parts.extend(f"- {lesson}" for lesson in context['lessons_learned'])
             body_parts.append("")
         
         # Next Steps
         if context['next_steps']:
-            body_parts.append("## Next Steps")
-            body_parts.append("")
-            body_parts.append("Future development directions identified:")
-            body_parts.append("")
-            for step in context['next_steps']:
-                body_parts.append(f"- {step}")
+            body_parts.append("## Next Steps\n\nFuture development directions identified:\n")
+            body_parts.extend(f"- {step}" for step in context['next_steps'])
             body_parts.append("")
         
         # Conclusion
-        body_parts.append("## Conclusion")
-        body_parts.append("")
-        body_parts.append("This comprehensive technical journal captures the complete development journey, from initial problem identification through final implementation and lessons learned. The iterative nature of the development process, the numerous challenges overcome, and the solutions developed provide valuable insights for future projects.")
-        body_parts.append("")
-        body_parts.append("The project demonstrates the importance of systematic problem-solving, careful technology selection, and iterative development. The extensive documentation of challenges, solutions, and lessons learned will be invaluable for future reference and for others facing similar technical challenges.")
+        body_parts.append(
+            "## Conclusion\n\n"
+            "This comprehensive technical journal captures the complete development journey, from initial problem identification through final implementation and lessons learned. The iterative nature of the development process, the numerous challenges overcome, and the solutions developed provide valuable insights for future projects.\n\n"
+            "The project demonstrates the importance of systematic problem-solving, careful technology selection, and iterative development. The extensive documentation of challenges, solutions, and lessons learned will be invaluable for future reference and for others facing similar technical challenges."
+        )
         
         return '\n'.join(body_parts)
     
     def create_comprehensive_tags(self, context: Dict[str, Any]) -> List[str]:
         """Create comprehensive tags."""
-        tags = ['technical', 'development', 'project', 'comprehensive', 'journal']
+        # A dict keeps insertion order and drops repeated tags as they are added
+        tags = dict.fromkeys(['technical', 'development', 'project', 'comprehensive', 'journal'])
         
         # Add technology-specific tags
         if context['technical_stack']:
-            tags.extend([tech.lower() for tech in context['technical_stack'][:5]])
+            tags.update(dict.fromkeys(tech.lower() for tech in context['technical_stack'][:5]))
         
         # Add project-specific tags
         if context['project_name']:
-            tags.append(context['project_name'].lower())
+            tags[context['project_name'].lower()] = None
         
-        return tags[:6]
+        return list(tags)[:6]
     
     def summarize(self, conversation: NormalizedConversation) -> SubstackDraft:
         """Generate comprehensive technical journal entry."""
@@ -645,9 +596,8 @@ class ComprehensiveTechnicalJournalSummarizer:
         ]
         
         # Ensure word count is within limits (increased for comprehensive content)
-        word_count = len(body_markdown.split())
-        if word_count > 1400:  # Increased from 900 to 1400 for comprehensive content
-            words = body_markdown.split()
+        words = body_markdown.split()
+        if len(words) > 1400:  # Increased from 900 to 1400 for comprehensive content
             body_markdown = ' '.join(words[:1400])
         
         return SubstackDraft(
@@ -664,3 +614,19 @@ def summarize_conversation_comprehensive(conversation: NormalizedConversation) -
     """Generate comprehensive technical journal entry with full conversation context."""
     summarizer = ComprehensiveTechnicalJournalSummarizer()
     return summarizer.summarize(conversation)
+
+
+def summarize_conversations_comprehensive(conversations: Iterable[NormalizedConversation], max_workers: Optional[int] = None, mp_context: Optional[BaseContext] = None) -> List[SubstackDraft]:
+    """Generate comprehensive technical journal entries for many conversations.
+    
+    Extraction is pure-Python regex work that holds the GIL, so conversations
+    are spread over worker processes rather than threads. Drafts are returned
+    in input order. Where workers are spawned (the default on macOS and
+    Windows), call this from under an ``if __name__ == "__main__":`` guard.
+    """
+    conversations = list(conversations)
+    if len(conversations) < 2:
+        return [summarize_conversation_comprehensive(conversation) for conversation in conversations]
+    
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+        return list(executor.map(summarize_conversation_comprehensive, conversations))
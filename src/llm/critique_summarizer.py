@@ -1,9 +1,122 @@
 """Critique summarizer for opinion and review content."""
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import re
+from dataclasses import dataclass
 from ..util.schema import SubstackDraft
 
+
+@dataclass
+class CritiqueNarrative:
+    """The extracted components a critique post is built from."""
+    thesis: str
+    context: str
+    arguments: List[str]
+    counterpoints: List[str]
+    stakes: str
+    anchors: List[Any]
+
+
+# Non-ASCII letters that re.IGNORECASE matches against ASCII cue letters
+IGNORECASE_FOLDS = {'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'}
+
+
+def _lower_aligned(text: str) -> str:
+    """Lowercase text, keeping every character at its original index.
+    
+    The cue patterns run on lowercased text, and matches are sliced back out
+    of the original, so characters whose lowercase form is longer than one
+    character are left as they are. The few non-ASCII letters that a
+    case-insensitive match treats as ASCII letters are folded to them.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text) and '\u0131' not in lowered and '\u017f' not in lowered:
+        return lowered
+    return ''.join(
+        IGNORECASE_FOLDS.get(c) or (c.lower() if len(c.lower()) == 1 else c) for c in text
+    )
+
+
+def _cue_pattern(cues: List[str]) -> Tuple[re.Pattern, Tuple[str, ...]]:
+    """Compile cues into one scan that captures the cue and its sentence.
+    
+    The lowercased cues are returned too, for a cheap substring prefilter.
+    """
+    cues = tuple(dict.fromkeys(cue.lower() for cue in cues))
+    return re.compile(r'\b(' + '|'.join(map(re.escape, cues)) + r')\b[^.]*\.'), cues
+
+
+def _has_any_cue(cues, text: str) -> bool:
+    """Substring prefilter: no cue in the text means no regex match either."""
+    return any(cue in text for cue in cues)
+
+
+def _ranked_cue_pattern(groups: List[List[str]]) -> Tuple[re.Pattern, Dict[str, int]]:
+    """Compile prioritised cue groups into one scan plus a cue -> rank table.
+    
+    The sentence tail is matched as a lookahead so every cue occurrence is
+    seen, even one inside the sentence of an earlier, lower-priority cue.
+    """
+    ranks = {cue.lower(): rank for rank, group in enumerate(groups) for cue in group}
+    pattern = re.compile(r'\b(' + '|'.join(map(re.escape, ranks)) + r')\b(?=[^.]*\.)')
+    return pattern, ranks
+
+
+def _first_ranked_cue(pattern: re.Pattern, ranks: Dict[str, int], text: str) -> Optional[re.Match]:
+    """Return the first occurrence of the highest-priority cue in lowercased text."""
+    if not _has_any_cue(ranks, text):
+        return None
+    
+    best = None
+    best_rank = len(ranks)
+    for match in pattern.finditer(text):
+        rank = ranks[match.group(1)]
+        if rank < best_rank:
+            best, best_rank = match, rank
+            if rank == 0:
+                break
+    return best
+
+
+# Explicit thesis statements, in priority order
+THESIS_PATTERN, THESIS_RANKS = _ranked_cue_pattern([
+    ['I argue', 'I contend', 'I believe', 'I think', 'My thesis', 'The claim', 'In my opinion'],
+    ['I agree', 'I disagree'],
+    ['My stance', 'My position'],
+])
+
+# Context indicators, in priority order
+CONTEXT_PATTERN, CONTEXT_RANKS = _ranked_cue_pattern([
+    ['about', 'regarding', 'concerning', 'on the topic of', 'when it comes to'],
+    ['the issue', 'the problem', 'the situation', 'the current state'],
+])
+
+# Consequence terms, in priority order
+CONSEQUENCE_PATTERN, CONSEQUENCE_RANKS = _ranked_cue_pattern([
+    [term] for term in ['risk', 'cost', 'harm', 'benefit', 'trade-off', 'consequence', 'impact', 'implication']
+])
+
+# Argument indicators
+ARGUMENT_PATTERN, ARGUMENT_CUES = _cue_pattern([
+    'because', 'since', 'given that', 'the reason', 'the evidence',
+    'First', 'Second', 'Third', 'Additionally', 'Furthermore', 'Moreover',
+    'The data', 'The research', 'Studies show',
+])
+
+# Counterpoint indicators
+COUNTERPOINT_PATTERN, COUNTERPOINT_CUES = _cue_pattern([
+    'however', 'but', 'on the other hand', 'critics might', 'steelman', 'opponents argue',
+    'while', 'although', 'despite', 'in contrast', 'conversely',
+    'Some might say', 'It could be argued', 'One might counter',
+])
+
+# Title prefix for the first stance verb found in the thesis
+TITLE_PREFIXES = [
+    ('argue', 'Critical Analysis'),
+    ('think', 'My Take'),
+    ('believe', 'Opinion'),
+]
+
 class CritiqueSummarizer:
     """Summarizes conversations into critique/opinion format."""
     
@@ -15,31 +128,31 @@ class CritiqueSummarizer:
     
     def summarize_conversation(self, conversation: Dict[str, Any]) -> SubstackDraft:
         """Summarize a conversation into critique format."""
-        from ..analysis.anchors import AnchorExtractor
+        from ..analysis.anchors import extract_anchors_cached
         
-        # Extract anchors from conversation
-        anchor_extractor = AnchorExtractor()
-        anchors = anchor_extractor.extract_anchors(conversation['messages'])
+        # Extract anchors from conversation, shared with earlier pipeline stages
+        anchors = extract_anchors_cached(conversation['messages'])
         
         # Extract full conversation text
         full_text = self._extract_full_conversation_text(conversation)
+        text_lower = _lower_aligned(full_text)
         
         # Extract critique components
-        thesis = self._extract_thesis(full_text, anchors)
-        context = self._extract_context(full_text, anchors)
-        arguments = self._extract_arguments(full_text, anchors)
-        counterpoints = self._extract_counterpoints(full_text, anchors)
-        stakes = self._extract_stakes(full_text, anchors)
+        thesis = self._extract_thesis(full_text, text_lower, anchors)
+        context = self._extract_context(full_text, text_lower, anchors)
+        arguments = self._extract_arguments(full_text, text_lower, anchors)
+        counterpoints = self._extract_counterpoints(full_text, text_lower, anchors)
+        stakes = self._extract_stakes(full_text, text_lower, anchors)
         
         # Build critique narrative
-        narrative = {
-            'thesis': thesis,
-            'context': context,
-            'arguments': arguments,
-            'counterpoints': counterpoints,
-            'stakes': stakes,
-            'anchors': anchors
-        }
+        narrative = CritiqueNarrative(
+            thesis=thesis,
+            context=context,
+            arguments=arguments,
+            counterpoints=counterpoints,
+            stakes=stakes,
+            anchors=anchors
+        )
         
         # Generate post content
         content = self._generate_post_content(narrative, conversation)
@@ -55,64 +168,49 @@ class CritiqueSummarizer:
     
     def _extract_full_conversation_text(self, conversation: Dict[str, Any]) -> str:
         """Extract all text from the conversation messages."""
-        messages = conversation.get('messages', [])
-        return ' '.join([msg.get('content', '') for msg in messages])
+        return ' '.join(msg.get('content', '') for msg in conversation.get('messages', ()))
     
-    def _extract_thesis(self, text: str, anchors: List[Any]) -> str:
+    def _extract_thesis(self, text: str, text_lower: str, anchors: List[Any]) -> str:
         """Extract the main thesis or claim."""
         # Look for explicit thesis statements
-        thesis_patterns = [
-            r'\b(I argue|I contend|I believe|I think|My thesis|The claim|In my opinion)\b[^.]*\.',
-            r'\b(I agree|I disagree)\b[^.]*\.',
-            r'\b(My stance|My position)\b[^.]*\.'
-        ]
-        
-        for pattern in thesis_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0].strip()
+        match = _first_ranked_cue(THESIS_PATTERN, THESIS_RANKS, text_lower)
+        if match:
+            return text[match.start(1):match.end(1)].strip()
         
         # Fallback: look for opinion anchors
-        opinion_anchors = [a for a in anchors if a.type == 'opinion']
-        if opinion_anchors:
-            return f"The main argument is that {opinion_anchors[0].text}"
+        opinion_anchor = next((a for a in anchors if a.type == 'opinion'), None)
+        if opinion_anchor:
+            return f"The main argument is that {opinion_anchor.text}"
         
         # Default thesis
         return "This discussion presents a critical perspective on the topic"
     
-    def _extract_context(self, text: str, anchors: List[Any]) -> str:
+    def _extract_context(self, text: str, text_lower: str, anchors: List[Any]) -> str:
         """Extract the context of what is being critiqued."""
         # Look for context indicators
-        context_patterns = [
-            r'\b(about|regarding|concerning|on the topic of|when it comes to)\b[^.]*\.',
-            r'\b(the issue|the problem|the situation|the current state)\b[^.]*\.'
-        ]
-        
-        for pattern in context_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0].strip()
-        
-        # Fallback: use first part of conversation
-        sentences = text.split('.')[:2]
-        return '. '.join(sentences).strip() + '.'
+        match = _first_ranked_cue(CONTEXT_PATTERN, CONTEXT_RANKS, text_lower)
+        if match:
+            return text[match.start(1):match.end(1)].strip()
+        
+        # Fallback: use first part of conversation, i.e. the first two
+        # '.'-separated pieces, without splitting the whole text
+        first_end = text.find('.')
+        if first_end == -1:
+            return text.strip() + '.'
+        second_end = text.find('.', first_end + 1)
+        second = text[first_end + 1:second_end] if second_end != -1 else text[first_end + 1:]
+        return f"{text[:first_end]}. {second}".strip() + '.'
     
-    def _extract_arguments(self, text: str, anchors: List[Any]) -> List[str]:
+    def _extract_arguments(self, text: str, text_lower: str, anchors: List[Any]) -> List[str]:
         """Extract supporting arguments."""
         arguments = []
         
         # Look for argument indicators
-        argument_patterns = [
-            r'\b(because|since|given that|the reason|the evidence)\b[^.]*\.',
-            r'\b(First|Second|Third|Additionally|Furthermore|Moreover)\b[^.]*\.',
-            r'\b(The data|The research|The evidence|Studies show)\b[^.]*\.'
-        ]
-        
-        for pattern in argument_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if len(match.strip()) > 20:  # Avoid very short matches
-                    arguments.append(match.strip())
+        if _has_any_cue(ARGUMENT_CUES, text_lower):
+            for match in ARGUMENT_PATTERN.finditer(text_lower):
+                cue = text[match.start(1):match.end(1)].strip()
+                if len(cue) > 20:  # Avoid very short matches
+                    arguments.append(cue)
         
         # Add anchor-based arguments
         for anchor in anchors[:3]:
@@ -121,22 +219,16 @@ class CritiqueSummarizer:
         
         return arguments[:4]  # Top 4 arguments
     
-    def _extract_counterpoints(self, text: str, anchors: List[Any]) -> List[str]:
+    def _extract_counterpoints(self, text: str, text_lower: str, anchors: List[Any]) -> List[str]:
         """Extract counterpoints or opposing views."""
         counterpoints = []
         
         # Look for counterpoint indicators
-        counterpoint_patterns = [
-            r'\b(however|but|on the other hand|critics might|steelman|opponents argue)\b[^.]*\.',
-            r'\b(while|although|despite|in contrast|conversely)\b[^.]*\.',
-            r'\b(Some might say|It could be argued|One might counter)\b[^.]*\.'
-        ]
-        
-        for pattern in counterpoint_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if len(match.strip()) > 20:
-                    counterpoints.append(match.strip())
+        if _has_any_cue(COUNTERPOINT_CUES, text_lower):
+            for match in COUNTERPOINT_PATTERN.finditer(text_lower):
+                cue = text[match.start(1):match.end(1)].strip()
+                if len(cue) > 20:
+                    counterpoints.append(cue)
         
         # Default counterpoints if none found
         if not counterpoints:
@@ -148,21 +240,18 @@ class CritiqueSummarizer:
         
         return counterpoints[:3]  # Top 3 counterpoints
     
-    def _extract_stakes(self, text: str, anchors: List[Any]) -> str:
+    def _extract_stakes(self, text: str, text_lower: str, anchors: List[Any]) -> str:
         """Extract the stakes or consequences."""
         # Look for consequence terms
-        consequence_terms = ['risk', 'cost', 'harm', 'benefit', 'trade-off', 'consequence', 'impact', 'implication']
-        
-        for term in consequence_terms:
-            pattern = rf'\b{term}\b[^.]*\.'
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                return matches[0].strip()
+        match = _first_ranked_cue(CONSEQUENCE_PATTERN, CONSEQUENCE_RANKS, text_lower)
+        if match:
+            end = text.index('.', match.end()) + 1
+            return text[match.start():end].strip()
         
         # Default stakes
         return "The implications of this perspective affect how we approach the issue and make decisions"
     
-    def _generate_post_content(self, narrative: Dict[str, Any], conversation: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_post_content(self, narrative: CritiqueNarrative, conversation: Dict[str, Any]) -> Dict[str, Any]:
         """Generate the complete post content."""
         title = self._create_title(narrative, conversation)
         dek = self._create_dek(narrative)
@@ -178,128 +267,112 @@ class CritiqueSummarizer:
             'body_markdown': body_markdown
         }
     
-    def _create_title(self, narrative: Dict[str, Any], conversation: Dict[str, Any]) -> str:
+    def _create_title(self, narrative: CritiqueNarrative, conversation: Dict[str, Any]) -> str:
         """Create a compelling title for the critique."""
-        thesis = narrative.get('thesis', 'Critical Analysis')
+        thesis = narrative.thesis
         
         # Extract key terms from thesis
-        if 'argue' in thesis.lower():
-            title = f"Critical Analysis: {thesis.split('argue')[1].strip()[:50]}"
-        elif 'think' in thesis.lower():
-            title = f"My Take: {thesis.split('think')[1].strip()[:50]}"
-        elif 'believe' in thesis.lower():
-            title = f"Opinion: {thesis.split('believe')[1].strip()[:50]}"
+        thesis_lower = thesis.lower()
+        for verb, prefix in TITLE_PREFIXES:
+            if verb in thesis_lower:
+                title = f"{prefix}: {thesis.partition(verb)[2].strip()[:50]}"
+                break
         else:
             title = f"Critical Analysis: {thesis[:50]}"
         
         return self._truncate_title(title)
     
-    def _create_dek(self, narrative: Dict[str, Any]) -> str:
+    def _create_dek(self, narrative: CritiqueNarrative) -> str:
         """Create dek for the critique."""
-        thesis = narrative.get('thesis', 'critical perspective')
-        context = narrative.get('context', 'the topic')
+        thesis = narrative.thesis
+        context = narrative.context
         
         dek = f"A critical examination of {context.lower()}, arguing that {thesis.lower()[:100]}"
         return self._truncate_dek(dek)
     
-    def _create_tldr(self, narrative: Dict[str, Any]) -> List[str]:
+    def _create_tldr(self, narrative: CritiqueNarrative) -> List[str]:
         """Create TL;DR for the critique."""
         tldr = []
         
-        thesis = narrative.get('thesis', 'Critical perspective')
+        thesis = narrative.thesis
         tldr.append(f"**Thesis:** {thesis}")
         
-        arguments = narrative.get('arguments', [])
+        arguments = narrative.arguments
         if arguments:
             tldr.append(f"**Arguments:** {len(arguments)} key points")
         
-        counterpoints = narrative.get('counterpoints', [])
+        counterpoints = narrative.counterpoints
         if counterpoints:
             tldr.append(f"**Counterpoints:** {len(counterpoints)} opposing views")
         
-        stakes = narrative.get('stakes', 'Important implications')
+        stakes = narrative.stakes
         tldr.append(f"**Stakes:** {stakes[:50]}...")
         
         tldr.append("**Takeaway:** Critical analysis with balanced perspective")
         
         return tldr[:self.max_tldr_points]
     
-    def _create_tags(self, narrative: Dict[str, Any]) -> List[str]:
+    def _create_tags(self, narrative: CritiqueNarrative) -> List[str]:
         """Create tags for the critique."""
-        base_tags = ['critique', 'opinion', 'analysis']
+        # A dict keeps insertion order and drops repeated tags as they are added
+        tags = dict.fromkeys(['critique', 'opinion', 'analysis'])
         
         # Add tags based on content
-        thesis = narrative.get('thesis', '').lower()
+        thesis = narrative.thesis.lower()
         if 'argue' in thesis or 'contend' in thesis:
-            base_tags.append('argument')
+            tags['argument'] = None
         if 'think' in thesis or 'believe' in thesis:
-            base_tags.append('perspective')
+            tags['perspective'] = None
         if 'agree' in thesis or 'disagree' in thesis:
-            base_tags.append('stance')
+            tags['stance'] = None
         
         # Add tags based on anchors
-        anchors = narrative.get('anchors', [])
+        anchors = narrative.anchors
         for anchor in anchors[:3]:
+            if len(tags) >= self.max_tags:
+                break
             if anchor.type == 'opinion':
-                base_tags.append(anchor.text.lower().replace(' ', '-'))
+                tags[anchor.text.lower().replace(' ', '-')] = None
         
-        return base_tags[:self.max_tags]
+        return list(tags)[:self.max_tags]
     
-    def _create_body_markdown(self, narrative: Dict[str, Any]) -> str:
+    def _create_body_markdown(self, narrative: CritiqueNarrative) -> str:
         """Create body markdown for the critique."""
-        thesis = narrative.get('thesis', 'Critical Analysis')
-        context = narrative.get('context', 'the topic')
-        arguments = narrative.get('arguments', [])
-        counterpoints = narrative.get('counterpoints', [])
-        stakes = narrative.get('stakes', 'Important implications')
-        anchors = narrative.get('anchors', [])
-        
-        markdown = []
-        
-        # Thesis
-        markdown.append("## Thesis")
-        markdown.append(thesis)
-        markdown.append("")
-        
-        # Context
-        markdown.append("## Context")
-        markdown.append(context)
-        markdown.append("")
-        
-        # Arguments
+        thesis = narrative.thesis
+        context = narrative.context
+        arguments = narrative.arguments
+        counterpoints = narrative.counterpoints
+        stakes = narrative.stakes
+        anchors = narrative.anchors
+        
+        # Message ids of the anchors that can be cited by position
+        msg_ids = [anchor.msg_id for anchor in anchors[:max(len(arguments), len(counterpoints))]]
+        
+        arguments_block = ""
         if arguments:
-            markdown.append("## Arguments")
-            markdown.append("")
-            for i, argument in enumerate(arguments, 1):
-                # Add citation if we have anchors
-                if anchors and i <= len(anchors):
-                    markdown.append(f"{i}. {argument} (msg {anchors[i-1].msg_id})")
-                else:
-                    markdown.append(f"{i}. {argument}")
-            markdown.append("")
-        
-        # Counterpoints
+            arguments_block = f"## Arguments\n\n{self._numbered_with_citations(arguments, msg_ids)}\n\n"
+        
+        counterpoints_block = ""
         if counterpoints:
-            markdown.append("## Counterpoints")
-            markdown.append("")
-            for i, counterpoint in enumerate(counterpoints, 1):
-                # Add citation if we have anchors
-                if anchors and i <= len(anchors):
-                    markdown.append(f"{i}. {counterpoint} (msg {anchors[i-1].msg_id})")
-                else:
-                    markdown.append(f"{i}. {counterpoint}")
-            markdown.append("")
-        
-        # Stakes
-        markdown.append("## Stakes")
-        markdown.append(stakes)
-        markdown.append("")
-        
-        # Takeaway
-        markdown.append("## Takeaway")
-        markdown.append("This critique provides a balanced perspective on the issue, considering both supporting arguments and opposing views. The analysis highlights the key implications and consequences of different approaches.")
-        
-        return '\n'.join(markdown)
+            counterpoints_block = f"## Counterpoints\n\n{self._numbered_with_citations(counterpoints, msg_ids)}\n\n"
+        
+        return (
+            f"## Thesis\n{thesis}\n\n"
+            f"## Context\n{context}\n\n"
+            f"{arguments_block}"
+            f"{counterpoints_block}"
+            f"## Stakes\n{stakes}\n\n"
+            "## Takeaway\n"
+            "This critique provides a balanced perspective on the issue, considering both supporting arguments and opposing views. The analysis highlights the key implications and consequences of different approaches."
+        )
+    
+    def _numbered_with_citations(self, items: List[str], msg_ids: List[int]) -> str:
+        """Number items, citing the anchor message id at the same position."""
+        cited = len(msg_ids)
+        return '\n'.join(
+            f"{i}. {item} (msg {msg_ids[i-1]})" if i <= cited else f"{i}. {item}"
+            for i, item in enumerate(items, 1)
+        )
     
     def _truncate_title(self, title: str, max_length: int = 80) -> str:
         """Truncate title to fit within character limit."""
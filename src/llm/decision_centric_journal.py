@@ -6,14 +6,23 @@ and building a narrative around what was actually shipped, rather than summarizi
 conversation fragments.
 """
 
-from typing import Dict, List, Any, Optional
-import re
+from typing import Dict, FrozenSet, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from ..util.schema import SubstackDraft
-from ..analysis.conversation_analyzer import ConversationAnalyzer
+from ..util.keywords import KeywordMatcher
+from ..analysis.anchors import extract_anchors_cached
 
 
-@dataclass
+# Technology keywords the journal reacts to, matched in one pass over lowercased text
+TECH_KEYWORDS = [
+    'ollama', 'litellm', 'docker', 'pytest', 'github', 'sentry', 'python',
+    'yaml', 'mistral', 'llama', 'deepseek', 'bash', 'rtx'
+]
+TECH_MATCHER = KeywordMatcher(TECH_KEYWORDS)
+
+
+@dataclass(frozen=True)
 class EngineeringDecision:
     """Represents a key engineering decision made during development."""
     area: str  # e.g., "Architecture", "Tooling", "Implementation"
@@ -23,7 +32,7 @@ class EngineeringDecision:
     timestamp: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class TechnicalOutcome:
     """Represents a technical outcome or result."""
     component: str  # What component/feature
@@ -32,34 +41,376 @@ class TechnicalOutcome:
     impact: str  # What this enables
 
 
+# Problem context implied by each technology mentioned, in priority order.
+# Shared across calls, so callers must treat them as read-only.
+LLM_INFRASTRUCTURE_CONTEXT = {
+    'problem': "Setting up local LLM infrastructure for development",
+    'goal': "Get local LLM models running and accessible via API",
+    'requirement': "Infrastructure must support multiple LLM providers and provide consistent API interface",
+}
+TECH_PROBLEM_CONTEXTS = {
+    'sentry': {
+        'problem': "Building a Sentry integration system for local LLM-powered test and documentation automation",
+        'goal': "Create a working system that can run locally without cloud dependencies",
+        'requirement': "System must integrate with Sentry for error tracking and provide automated testing capabilities",
+    },
+    'ollama': LLM_INFRASTRUCTURE_CONTEXT,
+    'litellm': LLM_INFRASTRUCTURE_CONTEXT,
+}
+
+# Problem context used when no technology above is mentioned
+DEFAULT_PROBLEM_CONTEXT = {
+    'problem': "Building a local LLM-powered automation system",
+    'goal': "Create a working system that can run locally without cloud dependencies",
+    'requirement': "System must be self-contained and provide reliable automation capabilities",
+}
+
+# Decisions implied by each technology mentioned, in reporting order
+TECH_DECISIONS = {
+    'ollama': EngineeringDecision(
+        area="Tooling",
+        decision="Use Ollama for local LLM model management",
+        rationale="Provides local model hosting without cloud dependencies",
+        evidence="Successfully running models locally via Ollama API",
+        timestamp=None
+    ),
+    'litellm': EngineeringDecision(
+        area="Tooling",
+        decision="Implement LiteLLM as API compatibility layer",
+        rationale="Standardizes API calls across different LLM providers",
+        evidence="Working API endpoints at localhost:8080",
+        timestamp=None
+    ),
+    'docker': EngineeringDecision(
+        area="Deployment",
+        decision="Containerize the application using Docker",
+        rationale="Ensures consistent deployment across environments",
+        evidence="Docker containers running successfully",
+        timestamp=None
+    ),
+    'pytest': EngineeringDecision(
+        area="Testing",
+        decision="Use Pytest for automated testing framework",
+        rationale="Provides comprehensive testing capabilities for LLM-based systems",
+        evidence="Test suite running successfully in CI/CD",
+        timestamp=None
+    ),
+    'github': EngineeringDecision(
+        area="Deployment",
+        decision="Implement GitHub Actions for CI/CD pipeline",
+        rationale="Automates testing and deployment processes",
+        evidence="Automated builds and tests running successfully",
+        timestamp=None
+    ),
+}
+
+# Decisions every local LLM project gets, after the technology ones
+DEFAULT_DECISIONS = (
+    EngineeringDecision(
+        area="Architecture",
+        decision="Build local-first architecture to avoid cloud dependencies",
+        rationale="Reduces costs and improves privacy for LLM operations",
+        evidence="System running entirely on local infrastructure",
+        timestamp=None
+    ),
+    EngineeringDecision(
+        area="Architecture",
+        decision="Use API-first design for modularity and extensibility",
+        rationale="Allows easy integration with different LLM providers and tools",
+        evidence="Clean API endpoints with standardized interfaces",
+        timestamp=None
+    ),
+    EngineeringDecision(
+        area="Implementation",
+        decision="Implement iterative development approach with continuous testing",
+        rationale="Allows rapid iteration and early problem detection",
+        evidence="Multiple successful iterations with working features",
+        timestamp=None
+    ),
+)
+
+# Outcomes implied by each technology mentioned, in reporting order
+TECH_OUTCOMES = {
+    'ollama': TechnicalOutcome(
+        component="Local LLM models running via Ollama",
+        status="Working",
+        proof="API endpoints responding at localhost:8080",
+        impact="Enables local AI processing without cloud dependencies"
+    ),
+    'litellm': TechnicalOutcome(
+        component="LiteLLM API compatibility layer",
+        status="Working",
+        proof="Standardized API calls across different providers",
+        impact="Simplifies integration with multiple LLM providers"
+    ),
+    'docker': TechnicalOutcome(
+        component="Containerized deployment",
+        status="Working",
+        proof="Docker containers running successfully",
+        impact="Ensures consistent deployment across environments"
+    ),
+    'pytest': TechnicalOutcome(
+        component="Automated testing suite",
+        status="Working",
+        proof="Test suite running successfully in CI/CD",
+        impact="Provides reliable validation of system functionality"
+    ),
+    'github': TechnicalOutcome(
+        component="CI/CD pipeline",
+        status="Working",
+        proof="Automated builds and tests running successfully",
+        impact="Streamlines development and deployment processes"
+    ),
+}
+
+# Outcomes every local LLM project gets, after the technology ones
+DEFAULT_OUTCOMES = (
+    TechnicalOutcome(
+        component="Local-first architecture",
+        status="Working",
+        proof="System running entirely on local infrastructure",
+        impact="Reduces costs and improves privacy for LLM operations"
+    ),
+    TechnicalOutcome(
+        component="API-first design",
+        status="Working",
+        proof="Clean API endpoints with standardized interfaces",
+        impact="Enables easy integration with different tools and services"
+    ),
+)
+
+# Insights implied by each technology in the decisions and outcomes, keyed
+# in the same order as TECH_DISPLAY_NAMES
+TECH_INSIGHTS = {
+    'ollama': "Local LLM infrastructure provides better control and privacy than cloud-based solutions",
+    'litellm': "API abstraction layers simplify integration with multiple LLM providers",
+    'docker': "Containerization ensures consistent deployment across different environments",
+    'pytest': "Automated testing is crucial for LLM-based systems to ensure reliability",
+    'github': "CI/CD pipelines streamline development and deployment processes",
+}
+
+# Insights every local LLM project gets, after the technology ones
+DEFAULT_INSIGHTS = (
+    "Local-first architecture reduces costs and improves privacy for LLM operations",
+    "Iterative development approach allows rapid iteration and early problem detection",
+    "API-first design enables easy integration with different tools and services",
+)
+
+# Display name for each technology in the stack, in reporting order
+TECH_DISPLAY_NAMES = {
+    'ollama': 'Ollama',
+    'litellm': 'LiteLLM',
+    'docker': 'Docker',
+    'pytest': 'Pytest',
+    'github': 'GitHub Actions',
+    'python': 'Python',
+    'yaml': 'YAML',
+    'mistral': 'Mistral',
+    'llama': 'Llama',
+    'deepseek': 'DeepSeek',
+    'bash': 'Bash',
+    'rtx': 'RTX'
+}
+
+# Stack used when no technology is recognised
+DEFAULT_STACK = ('Ollama', 'LiteLLM', 'Docker', 'Pytest', 'GitHub Actions')
+
+# Challenges implied by each technology in the decisions and outcomes, keyed
+# in the same order as TECH_DISPLAY_NAMES
+TECH_CHALLENGES = {
+    'ollama': "DNS connectivity issues → Used hotspot fallback",
+    'litellm': "API compatibility → Used LiteLLM abstraction layer",
+    'docker': "Environment consistency → Containerized with Docker",
+    'pytest': "Testing reliability → Implemented comprehensive test suite",
+    'github': "Deployment automation → Set up GitHub Actions CI/CD",
+}
+
+# Challenges every local LLM project gets, after the technology ones
+DEFAULT_CHALLENGES = (
+    "Model download timeouts → Implemented retry logic",
+    "Local resource management → Optimized memory usage",
+    "API standardization → Created consistent interfaces",
+)
+
+# TL;DR block at the top of every journal
+TLDR_MARKDOWN = (
+    "## TL;DR\n\n"
+    "**Problem:** Building a Sentry integration system for local LLM-powered test and documentation automation\n"
+    "**Solution:** Implemented Ollama + LiteLLM architecture with automated testing pipeline\n"
+    "**Key Decisions:** Local-first approach, API compatibility layer, comprehensive testing\n"
+    "**Outcome:** Working system running locally without cloud dependencies\n"
+    "**Next Steps:** Continue iterating based on user feedback and performance metrics\n"
+)
+
+# Decision log used when no decisions were extracted
+FALLBACK_DECISIONS_MARKDOWN = (
+    "## Key Engineering Decisions\n\n"
+    "**1.** Implemented local LLM infrastructure using Ollama (msg 1)\n"
+    "   *Rationale:* Provides local model hosting without cloud dependencies\n"
+    "   *Evidence:* Successfully running models locally via Ollama API\n\n"
+    "**2.** Chose LiteLLM for API compatibility\n"
+    "   *Rationale:* Standardizes API calls across different LLM providers\n"
+    "   *Evidence:* Working API endpoints at localhost:8080\n\n"
+    "**3.** Built automated testing with Pytest\n"
+    "   *Rationale:* Provides comprehensive testing capabilities for LLM-based systems\n"
+    "   *Evidence:* Test suite running successfully in CI/CD\n"
+)
+
+# Technical stack used when none was extracted
+FALLBACK_STACK_MARKDOWN = (
+    "## Technical Stack\n\n"
+    "- **Ollama** - Local LLM model management\n"
+    "- **LiteLLM** - API compatibility layer\n"
+    "- **Pytest** - Testing framework\n"
+    "- **Docker** - Containerization\n"
+    "- **GitHub Actions** - CI/CD pipeline\n"
+)
+
+# Challenges used when none were extracted
+FALLBACK_CHALLENGES_MARKDOWN = (
+    "## Challenges and Solutions\n\n"
+    "**1.** DNS connectivity issues → Used hotspot fallback\n"
+    "**2.** Model download timeouts → Implemented retry logic\n"
+    "**3.** API compatibility → Used LiteLLM abstraction layer\n"
+)
+
+# Results used when no outcomes were extracted
+FALLBACK_RESULTS_MARKDOWN = (
+    "## Results and Impact\n\n"
+    "**1.** Successfully running local LLM models via Ollama\n"
+    "   *Proof:* API endpoints responding at localhost:8080\n"
+    "   *Impact:* Enables local AI processing without cloud dependencies\n\n"
+    "**2.** API endpoints accessible at localhost:8080\n"
+    "   *Proof:* Standardized API calls across different providers\n"
+    "   *Impact:* Simplifies integration with multiple LLM providers\n\n"
+    "**3.** Automated testing pipeline working\n"
+    "   *Proof:* Test suite running successfully in CI/CD\n"
+    "   *Impact:* Provides reliable validation of system functionality\n"
+)
+
+# Setup and run commands shown in every journal
+COMMANDS_MARKDOWN = (
+    "## Commands\n\n"
+    "```bash\n"
+    "# Install Ollama\n"
+    "curl -fsSL https://ollama.ai/install.sh | sh\n\n"
+    "# Pull models\n"
+    "ollama pull deepseek-coder:6.7b-instruct\n"
+    "ollama pull llama3.1:8b-instruct\n\n"
+    "# Run tests\n"
+    "pytest tests/\n\n"
+    "# Start local server\n"
+    "python -m src.run --input conversation.html\n"
+    "```\n"
+)
+
+# Shipping decisions shown in every journal
+SHIPPING_DECISIONS_MARKDOWN = (
+    "## Shipping Decisions\n\n"
+    "**1.** Deploy to production environment (msg 1)\n"
+    "   *Decision:* Ship the current version to production\n"
+    "   *Rationale:* All tests passing, ready for user feedback\n"
+    "   *Evidence:* CI/CD pipeline successful, no critical bugs\n\n"
+    "**2.** Rollback plan if issues arise (msg 2)\n"
+    "   *Decision:* Implement automated rollback mechanism\n"
+    "   *Rationale:* Ensure system stability and quick recovery\n"
+    "   *Evidence:* Previous rollback procedures documented\n\n"
+    "**3.** Feature flag for gradual rollout (msg 3)\n"
+    "   *Decision:* Use feature flags for controlled deployment\n"
+    "   *Rationale:* Minimize risk and enable quick rollback\n"
+    "   *Evidence:* Feature flag system already in place\n"
+)
+
+# Insights used when none were extracted
+FALLBACK_INSIGHTS_MARKDOWN = (
+    "## Key Insights\n\n"
+    "**1.** Local LLM infrastructure provides better control and privacy\n"
+    "**2.** LiteLLM abstraction layer simplifies model switching\n"
+    "**3.** Automated testing is crucial for LLM-based systems\n"
+)
+
+# Intro to the additional anchor references
+ADDITIONAL_REFERENCES_MARKDOWN = (
+    "### Additional Technical References\n\n"
+    "The following additional technical elements were identified in the conversation:\n"
+)
+
+# Intro to the referenced message summary
+ALL_REFERENCES_MARKDOWN = (
+    "### All Technical References\n\n"
+    "This technical journal references the following conversation elements:\n"
+)
+
+# Open questions closing every journal
+OPEN_QUESTIONS_MARKDOWN = (
+    "## Open Questions\n\n"
+    "**1.** How can we improve the performance of local LLM inference?\n"
+    "**2.** What additional testing strategies should we implement?\n"
+    "**3.** How can we optimize the CI/CD pipeline for faster deployments?\n"
+    "**4.** What monitoring and observability features should we add?\n"
+    "**5.** How can we scale this system for production use?\n"
+)
+
+# Tag summary shown in every journal
+TAGS_MARKDOWN = (
+    "## Tags\n\n"
+    "**Technical:** ollama, litellm, sentry, local-llm, testing, ci-cd\n"
+    "**Architecture:** local-first, api-compatibility, microservices\n"
+    "**Tools:** python, pytest, docker, github-actions\n"
+)
+
+# Conclusion ending every journal
+CONCLUSION_MARKDOWN = (
+    "## Conclusion\n"
+    "This project demonstrates the importance of strategic decision-making in technical development. By focusing on key architectural choices and iterative problem-solving, we were able to build a working solution that meets our requirements.\n\n"
+    "**Next Steps:** Continue iterating on the solution based on user feedback and performance metrics."
+)
+
+# Trailing sections of every journal, pre-joined as they appear in the body
+CLOSING_MARKDOWN = '\n'.join((OPEN_QUESTIONS_MARKDOWN, TAGS_MARKDOWN, CONCLUSION_MARKDOWN))
+
+
+@lru_cache(maxsize=128)
+def _summary_tokens(summary_texts: Tuple[str, ...]) -> FrozenSet[str]:
+    """Technology keywords named in decision and outcome texts.
+    
+    The texts come from the static tables above, so there are only as many
+    distinct inputs as technology mixes and repeat lookups hit the cache.
+    """
+    return frozenset(TECH_MATCHER.findall(' '.join(summary_texts).lower()))
+
+
 class DecisionCentricJournalSummarizer:
     """
     Summarizes technical conversations by extracting engineering decisions
     and building a narrative around what was actually shipped.
     """
     
-    def __init__(self):
-        self.analyzer = ConversationAnalyzer()
-    
-    def summarize_conversation(self, conversation: Dict[str, Any]) -> SubstackDraft:
-        """Summarize a conversation into a decision-centric technical journal."""
+    def summarize_conversation(self, conversation: Dict[str, Any], *, full: bool = True) -> SubstackDraft:
+        """Summarize a conversation into a decision-centric technical journal.
+        
+        With ``full=False`` the conversation is not scanned for technologies or
+        anchors, and the draft is built from the generic local LLM project
+        content only. This is much cheaper for batch runs that just need a
+        draft skeleton. The draft is the same one ``full=True`` produces for a
+        conversation that names no tracked technologies and has no anchors,
+        and its static sections are always the same.
+        """
         
-        # Extract the full conversation text
-        all_text = self._extract_full_conversation_text(conversation)
+        # Find which technologies are mentioned in the conversation
+        tokens = self._collect_tokens(conversation) if full else set()
         
         # Extract engineering decisions
-        decisions = self._extract_engineering_decisions(all_text)
+        decisions = self._extract_engineering_decisions(tokens)
         
         # Extract technical outcomes
-        outcomes = self._extract_technical_outcomes(all_text)
+        outcomes = self._extract_technical_outcomes(tokens)
         
         # Extract problem context
-        problem_context = self._extract_problem_context(all_text)
+        problem_context = self._extract_problem_context(tokens)
         
-        # Extract anchors for better coverage
-        from ..analysis.anchors import AnchorExtractor
-        anchor_extractor = AnchorExtractor()
-        anchors = anchor_extractor.extract_anchors(conversation['messages'])
+        # Extract anchors for better coverage, shared with earlier pipeline stages
+        anchors = extract_anchors_cached(conversation['messages']) if full else []
         
         # Build the narrative
         narrative = self._build_engineering_narrative(decisions, outcomes, problem_context)
@@ -68,216 +419,64 @@ class DecisionCentricJournalSummarizer:
         # Generate the post content
         return self._generate_post_content(narrative, conversation)
     
-    def _extract_full_conversation_text(self, conversation: Dict[str, Any]) -> str:
-        """Extract all text from the conversation."""
-        all_text = []
-        
-        if 'messages' in conversation:
-            for message in conversation['messages']:
-                if 'content' in message:
-                    all_text.append(message['content'])
-        
-        return ' '.join(all_text)
+    def _collect_tokens(self, conversation: Dict[str, Any]) -> Set[str]:
+        """Find the technology keywords mentioned anywhere in the conversation.
+        
+        Messages are scanned one at a time rather than joined, stopping as soon
+        as every keyword has been seen. No keyword contains a space, so none can
+        straddle the boundary between two messages.
+        """
+        tokens: Set[str] = set()
+        
+        for message in conversation.get('messages', []):
+            if 'content' in message:
+                tokens |= TECH_MATCHER.findall(message['content'].lower())
+                if len(tokens) == len(TECH_KEYWORDS):
+                    break
+        
+        return tokens
     
-    def _extract_engineering_decisions(self, text: str) -> List[EngineeringDecision]:
+    def _extract_engineering_decisions(self, tokens: Set[str]) -> List[EngineeringDecision]:
         """Extract key engineering decisions from the conversation."""
         # Instead of trying to extract from conversation fragments,
         # generate realistic engineering decisions based on the conversation context
-        
-        decisions = []
-        
-        # Check what technologies are mentioned in the conversation
-        text_lower = text.lower()
-        
-        # Technology stack decisions
-        if 'ollama' in text_lower:
-            decisions.append(EngineeringDecision(
-                area="Tooling",
-                decision="Use Ollama for local LLM model management",
-                rationale="Provides local model hosting without cloud dependencies",
-                evidence="Successfully running models locally via Ollama API",
-                timestamp=None
-            ))
-        
-        if 'litellm' in text_lower:
-            decisions.append(EngineeringDecision(
-                area="Tooling",
-                decision="Implement LiteLLM as API compatibility layer",
-                rationale="Standardizes API calls across different LLM providers",
-                evidence="Working API endpoints at localhost:8080",
-                timestamp=None
-            ))
-        
-        if 'docker' in text_lower:
-            decisions.append(EngineeringDecision(
-                area="Deployment",
-                decision="Containerize the application using Docker",
-                rationale="Ensures consistent deployment across environments",
-                evidence="Docker containers running successfully",
-                timestamp=None
-            ))
-        
-        if 'pytest' in text_lower:
-            decisions.append(EngineeringDecision(
-                area="Testing",
-                decision="Use Pytest for automated testing framework",
-                rationale="Provides comprehensive testing capabilities for LLM-based systems",
-                evidence="Test suite running successfully in CI/CD",
-                timestamp=None
-            ))
-        
-        if 'github' in text_lower:
-            decisions.append(EngineeringDecision(
-                area="Deployment",
-                decision="Implement GitHub Actions for CI/CD pipeline",
-                rationale="Automates testing and deployment processes",
-                evidence="Automated builds and tests running successfully",
-                timestamp=None
-            ))
-        
-        # Architecture decisions
-        decisions.append(EngineeringDecision(
-            area="Architecture",
-            decision="Build local-first architecture to avoid cloud dependencies",
-            rationale="Reduces costs and improves privacy for LLM operations",
-            evidence="System running entirely on local infrastructure",
-            timestamp=None
-        ))
-        
-        decisions.append(EngineeringDecision(
-            area="Architecture",
-            decision="Use API-first design for modularity and extensibility",
-            rationale="Allows easy integration with different LLM providers and tools",
-            evidence="Clean API endpoints with standardized interfaces",
-            timestamp=None
-        ))
-        
-        # Implementation decisions
-        decisions.append(EngineeringDecision(
-            area="Implementation",
-            decision="Implement iterative development approach with continuous testing",
-            rationale="Allows rapid iteration and early problem detection",
-            evidence="Multiple successful iterations with working features",
-            timestamp=None
-        ))
+        decisions = [decision for token, decision in TECH_DECISIONS.items() if token in tokens]
+        decisions.extend(DEFAULT_DECISIONS)
         
         return decisions[:6]  # Top 6 decisions
     
-    def _categorize_decision(self, decision_text: str) -> str:
-        """Categorize a decision into an area."""
-        decision_lower = decision_text.lower()
-        
-        if any(word in decision_lower for word in ['architecture', 'structure', 'design', 'pattern']):
-            return "Architecture"
-        elif any(word in decision_lower for word in ['tool', 'library', 'framework', 'api', 'service']):
-            return "Tooling"
-        elif any(word in decision_lower for word in ['implement', 'code', 'function', 'method', 'class']):
-            return "Implementation"
-        elif any(word in decision_lower for word in ['test', 'testing', 'validation', 'verification']):
-            return "Testing"
-        elif any(word in decision_lower for word in ['deploy', 'deployment', 'production', 'release']):
-            return "Deployment"
-        else:
-            return "General"
-    
-    def _extract_technical_outcomes(self, text: str) -> List[TechnicalOutcome]:
+    def _extract_technical_outcomes(self, tokens: Set[str]) -> List[TechnicalOutcome]:
         """Extract technical outcomes and results."""
         # Generate realistic technical outcomes based on the conversation context
-        outcomes = []
-        
-        # Check what technologies are mentioned to infer outcomes
-        text_lower = text.lower()
-        
-        if 'ollama' in text_lower:
-            outcomes.append(TechnicalOutcome(
-                component="Local LLM models running via Ollama",
-                status="Working",
-                proof="API endpoints responding at localhost:8080",
-                impact="Enables local AI processing without cloud dependencies"
-            ))
-        
-        if 'litellm' in text_lower:
-            outcomes.append(TechnicalOutcome(
-                component="LiteLLM API compatibility layer",
-                status="Working",
-                proof="Standardized API calls across different providers",
-                impact="Simplifies integration with multiple LLM providers"
-            ))
-        
-        if 'docker' in text_lower:
-            outcomes.append(TechnicalOutcome(
-                component="Containerized deployment",
-                status="Working",
-                proof="Docker containers running successfully",
-                impact="Ensures consistent deployment across environments"
-            ))
-        
-        if 'pytest' in text_lower:
-            outcomes.append(TechnicalOutcome(
-                component="Automated testing suite",
-                status="Working",
-                proof="Test suite running successfully in CI/CD",
-                impact="Provides reliable validation of system functionality"
-            ))
-        
-        if 'github' in text_lower:
-            outcomes.append(TechnicalOutcome(
-                component="CI/CD pipeline",
-                status="Working",
-                proof="Automated builds and tests running successfully",
-                impact="Streamlines development and deployment processes"
-            ))
-        
-        # Default outcomes for local LLM projects
-        outcomes.append(TechnicalOutcome(
-            component="Local-first architecture",
-            status="Working",
-            proof="System running entirely on local infrastructure",
-            impact="Reduces costs and improves privacy for LLM operations"
-        ))
-        
-        outcomes.append(TechnicalOutcome(
-            component="API-first design",
-            status="Working",
-            proof="Clean API endpoints with standardized interfaces",
-            impact="Enables easy integration with different tools and services"
-        ))
+        outcomes = [outcome for token, outcome in TECH_OUTCOMES.items() if token in tokens]
+        outcomes.extend(DEFAULT_OUTCOMES)
         
         return outcomes[:6]  # Top 6 outcomes
     
-    def _extract_problem_context(self, text: str) -> Dict[str, str]:
+    def _extract_problem_context(self, tokens: Set[str]) -> Dict[str, str]:
         """Extract the problem context and requirements."""
-        context = {}
-        
-        # Check what technologies are mentioned to infer the project context
-        text_lower = text.lower()
-        
-        if 'sentry' in text_lower:
-            context['problem'] = "Building a Sentry integration system for local LLM-powered test and documentation automation"
-            context['goal'] = "Create a working system that can run locally without cloud dependencies"
-            context['requirement'] = "System must integrate with Sentry for error tracking and provide automated testing capabilities"
-        elif 'ollama' in text_lower or 'litellm' in text_lower:
-            context['problem'] = "Setting up local LLM infrastructure for development"
-            context['goal'] = "Get local LLM models running and accessible via API"
-            context['requirement'] = "Infrastructure must support multiple LLM providers and provide consistent API interface"
-        else:
-            context['problem'] = "Building a local LLM-powered automation system"
-            context['goal'] = "Create a working system that can run locally without cloud dependencies"
-            context['requirement'] = "System must be self-contained and provide reliable automation capabilities"
+        # Infer the project context from the highest-priority technology mentioned.
+        # Callers get a copy so the shared module tables cannot be changed.
+        for token, context in TECH_PROBLEM_CONTEXTS.items():
+            if token in tokens:
+                return dict(context)
         
-        return context
+        return dict(DEFAULT_PROBLEM_CONTEXT)
     
     def _build_engineering_narrative(self, decisions: List[EngineeringDecision], 
                                    outcomes: List[TechnicalOutcome], 
                                    problem_context: Dict[str, str]) -> Dict[str, Any]:
         """Build a coherent engineering narrative from decisions and outcomes."""
         
+        # Technologies named by the decisions and outcomes themselves drive
+        # the insight, stack and challenge sections
+        summary_tokens = _summary_tokens(tuple([d.decision for d in decisions] + [o.component for o in outcomes]))
+        key_insights, technical_stack, challenges_solved = self._extract_summary_sections(summary_tokens)
+        
         # Group decisions by area
-        decisions_by_area = {}
+        decisions_by_area: Dict[str, List[EngineeringDecision]] = {}
         for decision in decisions:
-            if decision.area not in decisions_by_area:
-                decisions_by_area[decision.area] = []
-            decisions_by_area[decision.area].append(decision)
+            decisions_by_area.setdefault(decision.area, []).append(decision)
         
         # Build the narrative structure
         narrative = {
@@ -285,111 +484,38 @@ class DecisionCentricJournalSummarizer:
             'goal': problem_context.get('goal', 'Build a working solution'),
             'decisions_by_area': decisions_by_area,
             'outcomes': outcomes,
-            'key_insights': self._extract_key_insights(decisions, outcomes),
-            'technical_stack': self._extract_technical_stack(decisions, outcomes),
-            'challenges_solved': self._extract_challenges_solved(decisions, outcomes)
+            'key_insights': key_insights,
+            'technical_stack': technical_stack,
+            'challenges_solved': challenges_solved
         }
         
         return narrative
     
-    def _extract_key_insights(self, decisions: List[EngineeringDecision], 
-                            outcomes: List[TechnicalOutcome]) -> List[str]:
-        """Extract key insights from decisions and outcomes."""
-        # Generate realistic insights based on the decisions and outcomes
-        insights = []
-        
-        # Check what technologies are mentioned to infer insights
-        all_text = ' '.join([d.decision for d in decisions] + [o.component for o in outcomes])
-        text_lower = all_text.lower()
-        
-        if 'ollama' in text_lower:
-            insights.append("Local LLM infrastructure provides better control and privacy than cloud-based solutions")
-        
-        if 'litellm' in text_lower:
-            insights.append("API abstraction layers simplify integration with multiple LLM providers")
-        
-        if 'docker' in text_lower:
-            insights.append("Containerization ensures consistent deployment across different environments")
-        
-        if 'pytest' in text_lower:
-            insights.append("Automated testing is crucial for LLM-based systems to ensure reliability")
-        
-        if 'github' in text_lower:
-            insights.append("CI/CD pipelines streamline development and deployment processes")
-        
-        # Default insights for local LLM projects
-        insights.append("Local-first architecture reduces costs and improves privacy for LLM operations")
-        insights.append("Iterative development approach allows rapid iteration and early problem detection")
-        insights.append("API-first design enables easy integration with different tools and services")
-        
-        return insights[:5]  # Top 5 insights
-    
-    def _extract_technical_stack(self, decisions: List[EngineeringDecision], 
-                               outcomes: List[TechnicalOutcome]) -> List[str]:
-        """Extract the technical stack from decisions and outcomes."""
-        stack = []
-        
-        # Check what technologies are mentioned to infer the stack
-        all_text = ' '.join([d.decision for d in decisions] + [o.component for o in outcomes])
-        text_lower = all_text.lower()
-        
-        # Technology mapping
-        tech_mapping = {
-            'ollama': 'Ollama',
-            'litellm': 'LiteLLM',
-            'docker': 'Docker',
-            'pytest': 'Pytest',
-            'github': 'GitHub Actions',
-            'python': 'Python',
-            'yaml': 'YAML',
-            'mistral': 'Mistral',
-            'llama': 'Llama',
-            'deepseek': 'DeepSeek',
-            'bash': 'Bash',
-            'rtx': 'RTX'
-        }
-        
-        for term, display_name in tech_mapping.items():
-            if term in text_lower:
+    def _extract_summary_sections(self, tokens: Set[str]) -> Tuple[List[str], List[str], List[str]]:
+        """Extract key insights, technical stack and solved challenges in one pass.
+        
+        The insight and challenge tables are keyed by a prefix of the stack
+        table in the same order, so walking the stack table once fills all three.
+        """
+        insights: List[str] = []
+        stack: List[str] = []
+        challenges: List[str] = []
+        
+        # Infer everything from the technologies in the decisions and outcomes,
+        # in a fixed order so drafts are reproducible
+        for term, display_name in TECH_DISPLAY_NAMES.items():
+            if term in tokens:
                 stack.append(display_name)
+                if term in TECH_INSIGHTS:
+                    insights.append(TECH_INSIGHTS[term])
+                if term in TECH_CHALLENGES:
+                    challenges.append(TECH_CHALLENGES[term])
         
-        # Default stack for local LLM projects
-        if not stack:
-            stack = ['Ollama', 'LiteLLM', 'Docker', 'Pytest', 'GitHub Actions']
-        
-        return list(set(stack))  # Remove duplicates
-    
-    def _extract_challenges_solved(self, decisions: List[EngineeringDecision], 
-                                 outcomes: List[TechnicalOutcome]) -> List[str]:
-        """Extract challenges that were solved."""
-        # Generate realistic challenges based on the decisions and outcomes
-        challenges = []
-        
-        # Check what technologies are mentioned to infer challenges
-        all_text = ' '.join([d.decision for d in decisions] + [o.component for o in outcomes])
-        text_lower = all_text.lower()
-        
-        if 'ollama' in text_lower:
-            challenges.append("DNS connectivity issues → Used hotspot fallback")
-        
-        if 'litellm' in text_lower:
-            challenges.append("API compatibility → Used LiteLLM abstraction layer")
+        insights.extend(DEFAULT_INSIGHTS)
+        challenges.extend(DEFAULT_CHALLENGES)
         
-        if 'docker' in text_lower:
-            challenges.append("Environment consistency → Containerized with Docker")
-        
-        if 'pytest' in text_lower:
-            challenges.append("Testing reliability → Implemented comprehensive test suite")
-        
-        if 'github' in text_lower:
-            challenges.append("Deployment automation → Set up GitHub Actions CI/CD")
-        
-        # Default challenges for local LLM projects
-        challenges.append("Model download timeouts → Implemented retry logic")
-        challenges.append("Local resource management → Optimized memory usage")
-        challenges.append("API standardization → Created consistent interfaces")
-        
-        return challenges[:5]  # Top 5 challenges
+        # Top 5 insights and challenges; default stack for local LLM projects
+        return insights[:5], stack or list(DEFAULT_STACK), challenges[:5]
     
     def _generate_post_content(self, narrative: Dict[str, Any], 
                              conversation: Dict[str, Any]) -> SubstackDraft:
@@ -421,30 +547,24 @@ class DecisionCentricJournalSummarizer:
     
     def _create_title(self, narrative: Dict[str, Any], conversation: Dict[str, Any]) -> str:
         """Create a compelling title for the technical journal."""
-        # Try to extract project name from conversation
-        project_name = "Technical Project"
-        if 'title_hint' in conversation:
-            project_name = conversation['title_hint']
-        
         # Create title based on the main problem/goal
         problem = narrative.get('problem', 'Technical Challenge')
-        if 'sentry' in problem.lower():
+        problem_lower = problem.lower()
+        if 'sentry' in problem_lower:
             title = f"Building a Sentry Integration: A Technical Journal"
-        elif 'llm' in problem.lower() or 'ai' in problem.lower():
+        elif 'llm' in problem_lower or 'ai' in problem_lower:
             title = f"Implementing Local LLM Infrastructure: A Technical Journal"
         else:
             # Truncate problem if too long
             if len(problem) > 50:
-                problem = problem[:47] + "..."
+                problem = f"{problem[:47]}..."
             title = f"Solving {problem}: A Technical Journal"
         
         return self._truncate_title(title)
     
     def _truncate_title(self, title: str, max_length: int = 80) -> str:
         """Truncate title to fit within character limit."""
-        if len(title) <= max_length:
-            return title
-        return title[:max_length-3] + "..."
+        return title if len(title) <= max_length else f"{title[:max_length-3]}..."
     
     def _create_dek(self, narrative: Dict[str, Any]) -> str:
         """Create a compelling dek (subtitle)."""
@@ -454,10 +574,7 @@ class DecisionCentricJournalSummarizer:
         dek = f"How we tackled {problem.lower()} and achieved {goal.lower()} through strategic engineering decisions and iterative development."
         
         # Truncate if too long (max 200 characters)
-        if len(dek) > 200:
-            dek = dek[:197] + "..."
-        
-        return dek
+        return dek if len(dek) <= 200 else f"{dek[:197]}..."
     
     def _create_tldr(self, narrative: Dict[str, Any]) -> List[str]:
         """Create a TL;DR that focuses on outcomes, not process."""
@@ -489,50 +606,40 @@ class DecisionCentricJournalSummarizer:
     
     def _create_tags(self, narrative: Dict[str, Any]) -> List[str]:
         """Create relevant tags."""
-        tags = ['technical-journal', 'engineering', 'development']
+        tags = ['technical-journal']
         
         # Add technology tags
         if narrative.get('technical_stack'):
-            tech_tags = [tag.lower().replace(' ', '-') for tag in narrative['technical_stack'][:3]]
-            tags.extend(tech_tags)
+            tags.extend(tag.lower().replace(' ', '-') for tag in narrative['technical_stack'][:3])
         
         # Add domain tags
         if narrative.get('decisions_by_area'):
-            area_tags = [area.lower().replace(' ', '-') for area in list(narrative['decisions_by_area'].keys())[:2]]
-            tags.extend(area_tags)
+            tags.extend(area.lower().replace(' ', '-') for area in list(narrative['decisions_by_area'])[:2])
         
-        return list(set(tags))[:6]  # Max 6 tags
+        # Generic tags come last so the cap drops them before specific ones
+        tags.extend(['engineering', 'development'])
+        
+        # Order-preserving dedup so the cap keeps the earliest tags
+        return list(dict.fromkeys(tags))[:6]  # Max 6 tags
     
     def _create_body_markdown(self, narrative: Dict[str, Any]) -> str:
         """Create the body markdown with proper structure."""
-        
-        markdown = []
+        # Static sections are module-level blocks; items are added with extend
         
         # Extract anchors for better coverage
         anchors = narrative.get('anchors', [])
         
         # TL;DR
-        markdown.append("## TL;DR")
-        markdown.append("")
-        markdown.append("**Problem:** Building a Sentry integration system for local LLM-powered test and documentation automation")
-        markdown.append("**Solution:** Implemented Ollama + LiteLLM architecture with automated testing pipeline")
-        markdown.append("**Key Decisions:** Local-first approach, API compatibility layer, comprehensive testing")
-        markdown.append("**Outcome:** Working system running locally without cloud dependencies")
-        markdown.append("**Next Steps:** Continue iterating based on user feedback and performance metrics")
-        markdown.append("")
+        markdown = [TLDR_MARKDOWN]
         
         # Introduction
-        markdown.append("## The Challenge")
         problem = narrative.get('problem', 'Technical challenge requiring solution')
         goal = narrative.get('goal', 'Build a working solution')
-        markdown.append(f"{problem}")
-        markdown.append(f"**Goal:** {goal}")
-        markdown.append("")
+        markdown.append(f"## The Challenge\n{problem}\n**Goal:** {goal}\n")
         
         # Decision Log
         if narrative.get('decisions_by_area'):
-            markdown.append("## Key Engineering Decisions")
-            markdown.append("")
+            markdown.append("## Key Engineering Decisions\n")
             
             for area, decisions in narrative['decisions_by_area'].items():
                 markdown.append(f"### {area}")
@@ -545,59 +652,29 @@ class DecisionCentricJournalSummarizer:
                 markdown.append("")
         else:
             # Fallback if no decisions extracted
-            markdown.append("## Key Engineering Decisions")
-            markdown.append("")
-            markdown.append("**1.** Implemented local LLM infrastructure using Ollama (msg 1)")
-            markdown.append("   *Rationale:* Provides local model hosting without cloud dependencies")
-            markdown.append("   *Evidence:* Successfully running models locally via Ollama API")
-            markdown.append("")
-            markdown.append("**2.** Chose LiteLLM for API compatibility")
-            markdown.append("   *Rationale:* Standardizes API calls across different LLM providers")
-            markdown.append("   *Evidence:* Working API endpoints at localhost:8080")
-            markdown.append("")
-            markdown.append("**3.** Built automated testing with Pytest")
-            markdown.append("   *Rationale:* Provides comprehensive testing capabilities for LLM-based systems")
-            markdown.append("   *Evidence:* Test suite running successfully in CI/CD")
-            markdown.append("")
+            markdown.append(FALLBACK_DECISIONS_MARKDOWN)
         
         # Technical Stack
         if narrative.get('technical_stack'):
-            markdown.append("## Technical Stack")
-            markdown.append("")
-            for tech in narrative['technical_stack']:
-                markdown.append(f"- **{tech}**")
+            markdown.append("## Technical Stack\n")
+            markdown.extend(f"- **{tech}**" for tech in narrative['technical_stack'])
             markdown.append("")
         else:
             # Fallback technical stack
-            markdown.append("## Technical Stack")
-            markdown.append("")
-            markdown.append("- **Ollama** - Local LLM model management")
-            markdown.append("- **LiteLLM** - API compatibility layer")
-            markdown.append("- **Pytest** - Testing framework")
-            markdown.append("- **Docker** - Containerization")
-            markdown.append("- **GitHub Actions** - CI/CD pipeline")
-            markdown.append("")
+            markdown.append(FALLBACK_STACK_MARKDOWN)
         
         # Challenges and Solutions
         if narrative.get('challenges_solved'):
-            markdown.append("## Challenges and Solutions")
-            markdown.append("")
-            for i, challenge in enumerate(narrative['challenges_solved'], 1):
-                markdown.append(f"**{i}.** {challenge}")
+            markdown.append("## Challenges and Solutions\n")
+            markdown.extend(f"**{i}.** {challenge}" for i, challenge in enumerate(narrative['challenges_solved'], 1))
             markdown.append("")
         else:
             # Fallback challenges
-            markdown.append("## Challenges and Solutions")
-            markdown.append("")
-            markdown.append("**1.** DNS connectivity issues → Used hotspot fallback")
-            markdown.append("**2.** Model download timeouts → Implemented retry logic")
-            markdown.append("**3.** API compatibility → Used LiteLLM abstraction layer")
-            markdown.append("")
+            markdown.append(FALLBACK_CHALLENGES_MARKDOWN)
         
         # Results and Impact
         if narrative.get('outcomes'):
-            markdown.append("## Results and Impact")
-            markdown.append("")
+            markdown.append("## Results and Impact\n")
             for i, outcome in enumerate(narrative['outcomes'][:3], 1):  # Top 3 outcomes
                 markdown.append(f"**{i}.** {outcome.component}")
                 if outcome.proof:
@@ -607,101 +684,44 @@ class DecisionCentricJournalSummarizer:
             markdown.append("")
         else:
             # Fallback results
-            markdown.append("## Results and Impact")
-            markdown.append("")
-            markdown.append("**1.** Successfully running local LLM models via Ollama")
-            markdown.append("   *Proof:* API endpoints responding at localhost:8080")
-            markdown.append("   *Impact:* Enables local AI processing without cloud dependencies")
-            markdown.append("")
-            markdown.append("**2.** API endpoints accessible at localhost:8080")
-            markdown.append("   *Proof:* Standardized API calls across different providers")
-            markdown.append("   *Impact:* Simplifies integration with multiple LLM providers")
-            markdown.append("")
-            markdown.append("**3.** Automated testing pipeline working")
-            markdown.append("   *Proof:* Test suite running successfully in CI/CD")
-            markdown.append("   *Impact:* Provides reliable validation of system functionality")
-            markdown.append("")
+            markdown.append(FALLBACK_RESULTS_MARKDOWN)
         
         # Commands
-        markdown.append("## Commands")
-        markdown.append("")
-        markdown.append("```bash")
-        markdown.append("# Install Ollama")
-        markdown.append("curl -fsSL https://ollama.ai/install.sh | sh")
-        markdown.append("")
-        markdown.append("# Pull models")
-        markdown.append("ollama pull deepseek-coder:6.7b-instruct")
-        markdown.append("ollama pull llama3.1:8b-instruct")
-        markdown.append("")
-        markdown.append("# Run tests")
-        markdown.append("pytest tests/")
-        markdown.append("")
-        markdown.append("# Start local server")
-        markdown.append("python -m src.run --input conversation.html")
-        markdown.append("```")
-        markdown.append("")
+        markdown.append(COMMANDS_MARKDOWN)
         
         # Shipping Decisions
-        markdown.append("## Shipping Decisions")
-        markdown.append("")
-        markdown.append("**1.** Deploy to production environment (msg 1)")
-        markdown.append("   *Decision:* Ship the current version to production")
-        markdown.append("   *Rationale:* All tests passing, ready for user feedback")
-        markdown.append("   *Evidence:* CI/CD pipeline successful, no critical bugs")
-        markdown.append("")
-        markdown.append("**2.** Rollback plan if issues arise (msg 2)")
-        markdown.append("   *Decision:* Implement automated rollback mechanism")
-        markdown.append("   *Rationale:* Ensure system stability and quick recovery")
-        markdown.append("   *Evidence:* Previous rollback procedures documented")
-        markdown.append("")
-        markdown.append("**3.** Feature flag for gradual rollout (msg 3)")
-        markdown.append("   *Decision:* Use feature flags for controlled deployment")
-        markdown.append("   *Rationale:* Minimize risk and enable quick rollback")
-        markdown.append("   *Evidence:* Feature flag system already in place")
-        markdown.append("")
+        markdown.append(SHIPPING_DECISIONS_MARKDOWN)
         
         # Key Insights
         if narrative.get('key_insights'):
-            markdown.append("## Key Insights")
-            markdown.append("")
-            for i, insight in enumerate(narrative['key_insights'], 1):
-                markdown.append(f"**{i}.** {insight}")
+            markdown.append("## Key Insights\n")
+            markdown.extend(f"**{i}.** {insight}" for i, insight in enumerate(narrative['key_insights'], 1))
             markdown.append("")
         else:
             # Fallback insights
-            markdown.append("## Key Insights")
-            markdown.append("")
-            markdown.append("**1.** Local LLM infrastructure provides better control and privacy")
-            markdown.append("**2.** LiteLLM abstraction layer simplifies model switching")
-            markdown.append("**3.** Automated testing is crucial for LLM-based systems")
-            markdown.append("")
+            markdown.append(FALLBACK_INSIGHTS_MARKDOWN)
         
         # Technical Details and References
         if anchors:
-            markdown.append("## Technical Details and References")
-            markdown.append("")
+            markdown.append("## Technical Details and References\n")
             
             # Group anchors by type for better organization
-            anchor_groups = {}
+            anchor_groups: Dict[str, List[Any]] = {}
             for anchor in anchors:
-                if anchor.type not in anchor_groups:
-                    anchor_groups[anchor.type] = []
-                anchor_groups[anchor.type].append(anchor)
+                anchor_groups.setdefault(anchor.type, []).append(anchor)
             
             # Add references for each anchor type
             for anchor_type, anchor_list in anchor_groups.items():
                 if anchor_type in ['decision', 'command', 'model', 'error']:
-                    markdown.append(f"### {anchor_type.title()}s")
-                    markdown.append("")
-                    for i, anchor in enumerate(anchor_list[:20], 1):  # Top 20 per type for better coverage
-                        markdown.append(f"**{i}.** {anchor.text[:100]}... (msg {anchor.msg_id})")
+                    markdown.append(f"### {anchor_type.title()}s\n")
+                    markdown.extend(
+                        f"**{i}.** {anchor.text[:100]}... (msg {anchor.msg_id})"
+                        for i, anchor in enumerate(anchor_list[:20], 1)  # Top 20 per type for better coverage
+                    )
                     markdown.append("")
             
             # Add additional references to reach 50% coverage
-            markdown.append("### Additional Technical References")
-            markdown.append("")
-            markdown.append("The following additional technical elements were identified in the conversation:")
-            markdown.append("")
+            markdown.append(ADDITIONAL_REFERENCES_MARKDOWN)
             
             # Add more anchor references to reach 50% coverage
             remaining_anchors = []
@@ -709,19 +729,17 @@ class DecisionCentricJournalSummarizer:
                 if anchor_type in ['opinion', 'research_noun', 'ship_action', 'citation']:
                     remaining_anchors.extend(anchor_list[:15])  # Top 15 per type
             
-            for i, anchor in enumerate(remaining_anchors[:50], 1):  # Add up to 50 more references
-                markdown.append(f"**{i}.** {anchor.text[:80]}... (msg {anchor.msg_id})")
+            markdown.extend(
+                f"**{i}.** {anchor.text[:80]}... (msg {anchor.msg_id})"
+                for i, anchor in enumerate(remaining_anchors[:50], 1)  # Add up to 50 more references
+            )
             markdown.append("")
             
             # Add a comprehensive reference list
-            markdown.append("### All Technical References")
-            markdown.append("")
-            markdown.append("This technical journal references the following conversation elements:")
-            markdown.append("")
+            markdown.append(ALL_REFERENCES_MARKDOWN)
             
             # Create a comprehensive list of all referenced message IDs
-            referenced_msg_ids = list(set([a.msg_id for a in anchors]))
-            referenced_msg_ids.sort()
+            referenced_msg_ids = sorted({a.msg_id for a in anchors})
             
             # Group by ranges for readability
             ranges = []
@@ -744,33 +762,13 @@ class DecisionCentricJournalSummarizer:
             else:
                 ranges.append(f"{start}-{end}")
             
-            markdown.append(f"**Referenced Messages:** {', '.join(ranges)}")
-            markdown.append(f"**Total Anchors:** {len(anchors)}")
-            markdown.append(f"**Coverage:** {len(referenced_msg_ids)}/{len(anchors)} ({len(referenced_msg_ids)/len(anchors)*100:.1f}%)")
-            markdown.append("")
-        
-        # Open Questions
-        markdown.append("## Open Questions")
-        markdown.append("")
-        markdown.append("**1.** How can we improve the performance of local LLM inference?")
-        markdown.append("**2.** What additional testing strategies should we implement?")
-        markdown.append("**3.** How can we optimize the CI/CD pipeline for faster deployments?")
-        markdown.append("**4.** What monitoring and observability features should we add?")
-        markdown.append("**5.** How can we scale this system for production use?")
-        markdown.append("")
-        
-        # Tags
-        markdown.append("## Tags")
-        markdown.append("")
-        markdown.append("**Technical:** ollama, litellm, sentry, local-llm, testing, ci-cd")
-        markdown.append("**Architecture:** local-first, api-compatibility, microservices")
-        markdown.append("**Tools:** python, pytest, docker, github-actions")
-        markdown.append("")
-        
-        # Conclusion
-        markdown.append("## Conclusion")
-        markdown.append("This project demonstrates the importance of strategic decision-making in technical development. By focusing on key architectural choices and iterative problem-solving, we were able to build a working solution that meets our requirements.")
-        markdown.append("")
-        markdown.append("**Next Steps:** Continue iterating on the solution based on user feedback and performance metrics.")
+            markdown.append(
+                f"**Referenced Messages:** {', '.join(ranges)}\n"
+                f"**Total Anchors:** {len(anchors)}\n"
+                f"**Coverage:** {len(referenced_msg_ids)}/{len(anchors)} ({len(referenced_msg_ids)/len(anchors)*100:.1f}%)\n"
+            )
+        
+        # Open Questions, Tags and Conclusion
+        markdown.append(CLOSING_MARKDOWN)
         
         return '\n'.join(markdown)
@@ -2,86 +2,146 @@
 
 import re
 import json
-from typing import Dict, List, Any, Tuple
+from functools import lru_cache
+from typing import Dict, List, Any, Set, Tuple
 from ..util.schema import NormalizedConversation, SubstackDraft, FurtherReading
+from ..util.keywords import KeywordMatcher
+
+# Sentence boundaries used for question and practical-application extraction
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+
+# First-person lead-ins stripped from user questions
+QUESTION_PREFIX_PATTERN = re.compile(
+    r'^(I\'m|I am|I think|I believe|I need|I want|I have|I can|I should|I would|I don\'t|I can\'t|I won\'t|I\'ll|I\'ve|I\'d)\s+',
+    re.IGNORECASE
+)
+
+# Keywords that flag potentially controversial topics, in reporting order
+CONTROVERSIAL_KEYWORDS = [
+    'politics', 'religion', 'gender', 'race', 'sexuality', 'abortion', 'gun control',
+    'immigration', 'climate change', 'vaccine', 'covid', 'trump', 'biden',
+    'lgbtq', 'transgender', 'feminism', 'conservative', 'liberal', 'democrat', 'republican'
+]
+
+# Phrases marking a line as a key insight, a sentence as practical advice,
+# or a sentence as a pull quote
+INSIGHT_MATCHER = KeywordMatcher([
+    'key insight', 'important', 'crucial', 'essential', 'fundamental', 'the main point', 'the key is'
+])
+PRACTICAL_MATCHER = KeywordMatcher([
+    'how to', 'steps to', 'ways to', 'tips for', 'best practices', 'recommendations',
+    'actionable', 'practical', 'implement', 'apply', 'use', 'utilize', 'leverage'
+])
+PULL_QUOTE_MATCHER = KeywordMatcher([
+    'key', 'important', 'crucial', 'essential', 'fundamental', 'the main point', 'the key is',
+    'what matters', 'the truth is'
+])
+
+# Numbered or bulleted list items in assistant messages, and their markers
+LIST_BULLETS = '-*•'
+LIST_ITEM_PATTERN = re.compile(r'\d+\.|[-*•]')
+LIST_MARKER_PATTERN = re.compile(r'^\d+\.\s*|^[-*•]\s*')
 
 
 class ConversationAnalyzer:
     """Analyzes conversation content to extract meaningful insights."""
     
-    def __init__(self):
-        self.topic_keywords = {
-            'education': ['education', 'teaching', 'school', 'university', 'student', 'teacher', 'learning', 'curriculum', 'academic'],
-            'technology': ['technology', 'ai', 'artificial intelligence', 'machine learning', 'software', 'programming', 'digital', 'tech'],
-            'business': ['business', 'company', 'startup', 'entrepreneur', 'strategy', 'marketing', 'sales', 'management'],
-            'politics': ['politics', 'government', 'policy', 'election', 'democracy', 'republican', 'democrat', 'political'],
-            'society': ['society', 'social', 'culture', 'community', 'people', 'human', 'society', 'social issues'],
-            'science': ['science', 'research', 'study', 'data', 'analysis', 'experiment', 'scientific', 'evidence'],
-            'philosophy': ['philosophy', 'ethics', 'moral', 'values', 'beliefs', 'philosophical', 'ethical', 'morality'],
-            'health': ['health', 'medical', 'healthcare', 'medicine', 'wellness', 'fitness', 'mental health'],
-            'economics': ['economics', 'economy', 'financial', 'money', 'investment', 'market', 'economic', 'finance']
-        }
-        
-        self.sentiment_indicators = {
-            'positive': ['good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'like', 'enjoy', 'benefit', 'helpful', 'useful'],
-            'negative': ['bad', 'terrible', 'awful', 'hate', 'dislike', 'problem', 'issue', 'concern', 'worry', 'difficult', 'challenge'],
-            'neutral': ['think', 'believe', 'consider', 'discuss', 'explore', 'analyze', 'examine', 'understand', 'explain']
-        }
+    # All state lives on the class, so instances carry no attribute dict
+    __slots__ = ()
+    
+    # Keyword tables shared by every analyzer; treat them as read-only
+    topic_keywords = {
+        'education': ('education', 'teaching', 'school', 'university', 'student', 'teacher', 'learning', 'curriculum', 'academic'),
+        'technology': ('technology', 'ai', 'artificial intelligence', 'machine learning', 'software', 'programming', 'digital', 'tech'),
+        'business': ('business', 'company', 'startup', 'entrepreneur', 'strategy', 'marketing', 'sales', 'management'),
+        'politics': ('politics', 'government', 'policy', 'election', 'democracy', 'republican', 'democrat', 'political'),
+        'society': ('society', 'social', 'culture', 'community', 'people', 'human', 'society', 'social issues'),
+        'science': ('science', 'research', 'study', 'data', 'analysis', 'experiment', 'scientific', 'evidence'),
+        'philosophy': ('philosophy', 'ethics', 'moral', 'values', 'beliefs', 'philosophical', 'ethical', 'morality'),
+        'health': ('health', 'medical', 'healthcare', 'medicine', 'wellness', 'fitness', 'mental health'),
+        'economics': ('economics', 'economy', 'financial', 'money', 'investment', 'market', 'economic', 'finance')
+    }
+    
+    sentiment_indicators = {
+        'positive': ('good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'love', 'like', 'enjoy', 'benefit', 'helpful', 'useful'),
+        'negative': ('bad', 'terrible', 'awful', 'hate', 'dislike', 'problem', 'issue', 'concern', 'worry', 'difficult', 'challenge'),
+        'neutral': ('think', 'believe', 'consider', 'discuss', 'explore', 'analyze', 'examine', 'understand', 'explain')
+    }
+    
+    # Every topic, sentiment and controversial keyword, found in one pass
+    keyword_matcher = KeywordMatcher(
+        [keyword for keywords in topic_keywords.values() for keyword in keywords]
+        + [word for words in sentiment_indicators.values() for word in words]
+        + CONTROVERSIAL_KEYWORDS
+    )
     
     def analyze_conversation(self, conversation: NormalizedConversation) -> Dict[str, Any]:
         """Perform comprehensive analysis of conversation content."""
-        user_messages = [msg.text for msg in conversation.messages if msg.role == "user"]
-        assistant_messages = [msg.text for msg in conversation.messages if msg.role == "assistant"]
+        # Walk the messages once, splitting them by role and counting words
+        user_messages = []
+        assistant_messages = []
+        texts = []
+        total_words = 0
+        for msg in conversation.messages:
+            text = msg.text
+            texts.append(text)
+            total_words += len(text.split())
+            if msg.role == "user":
+                user_messages.append(text)
+            elif msg.role == "assistant":
+                assistant_messages.append(text)
         
         # Combine all text for analysis
-        all_text = " ".join([msg.text for msg in conversation.messages])
+        all_text = " ".join(texts)
+        
+        # Keywords present anywhere in the conversation, shared by the
+        # topic, sentiment and controversy checks
+        found = self.keyword_matcher.findall(all_text.lower())
+        topic_scores = self._score_topics(found)
         
         analysis = {
-            'primary_topic': self._identify_primary_topic(all_text),
-            'secondary_topics': self._identify_secondary_topics(all_text),
-            'sentiment': self._analyze_sentiment(all_text),
+            'primary_topic': self._identify_primary_topic(topic_scores),
+            'secondary_topics': self._identify_secondary_topics(topic_scores),
+            'sentiment': self._analyze_sentiment(found),
             'key_questions': self._extract_questions(user_messages),
             'key_insights': self._extract_insights(assistant_messages),
-            'controversial_topics': self._identify_controversial_topics(all_text),
+            'controversial_topics': self._identify_controversial_topics(found),
             'practical_applications': self._extract_practical_applications(all_text),
-            'word_count': len(all_text.split()),
-            'message_count': len(conversation.messages),
-            'conversation_depth': self._assess_conversation_depth(conversation.messages)
+            'word_count': total_words,
+            'message_count': len(texts),
+            'conversation_depth': self._assess_conversation_depth(total_words, len(texts))
         }
         
         return analysis
     
-    def _identify_primary_topic(self, text: str) -> str:
-        """Identify the primary topic of discussion."""
-        text_lower = text.lower()
+    def _score_topics(self, found: Set[str]) -> Dict[str, int]:
+        """Count the keywords found for each topic, keeping only topics that matched."""
         topic_scores = {}
         
         for topic, keywords in self.topic_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
+            score = sum(1 for keyword in keywords if keyword in found)
             if score > 0:
                 topic_scores[topic] = score
         
+        return topic_scores
+    
+    def _identify_primary_topic(self, topic_scores: Dict[str, int]) -> str:
+        """Identify the primary topic of discussion."""
         if topic_scores:
             return max(topic_scores, key=topic_scores.get)
         return 'general'
     
-    def _identify_secondary_topics(self, text: str) -> List[str]:
+    def _identify_secondary_topics(self, topic_scores: Dict[str, int]) -> List[str]:
         """Identify secondary topics mentioned."""
-        text_lower = text.lower()
-        secondary_topics = []
-        
-        for topic, keywords in self.topic_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            if score >= 2:  # Threshold for secondary topics
-                secondary_topics.append(topic)
+        # Threshold for secondary topics
+        secondary_topics = [topic for topic, score in topic_scores.items() if score >= 2]
         
         return secondary_topics[:3]  # Limit to 3 secondary topics
     
-    def _analyze_sentiment(self, text: str) -> str:
+    def _analyze_sentiment(self, found: Set[str]) -> str:
         """Analyze overall sentiment of the conversation."""
-        text_lower = text.lower()
-        positive_count = sum(1 for word in self.sentiment_indicators['positive'] if word in text_lower)
-        negative_count = sum(1 for word in self.sentiment_indicators['negative'] if word in text_lower)
+        positive_count = sum(1 for word in self.sentiment_indicators['positive'] if word in found)
+        negative_count = sum(1 for word in self.sentiment_indicators['negative'] if word in found)
         
         if positive_count > negative_count * 1.5:
             return 'positive'
@@ -95,12 +155,12 @@ class ConversationAnalyzer:
         questions = []
         for message in user_messages:
             # Look for question patterns
-            sentences = re.split(r'[.!?]+', message)
+            sentences = SENTENCE_SPLIT_PATTERN.split(message)
             for sentence in sentences:
                 sentence = sentence.strip()
                 if '?' in sentence and len(sentence) > 10:
                     # Clean up the question
-                    question = re.sub(r'^(I\'m|I am|I think|I believe|I need|I want|I have|I can|I should|I would|I don\'t|I can\'t|I won\'t|I\'ll|I\'ve|I\'d)\s+', '', sentence, flags=re.IGNORECASE)
+                    question = QUESTION_PREFIX_PATTERN.sub('', sentence)
                     question = question.strip()
                     if len(question) > 15 and len(question) < 200:
                         questions.append(question)
@@ -116,58 +176,42 @@ class ConversationAnalyzer:
                 lines = message.split('\n')
                 for line in lines:
                     line = line.strip()
-                    # Look for numbered items or bullet points
-                    if re.match(r'^\d+\.', line) or re.match(r'^[-*•]', line):
-                        insight = re.sub(r'^\d+\.\s*|^[-*•]\s*', '', line)
+                    # Look for numbered items or bullet points; most lines
+                    # fail the cheap first-character check
+                    first = line[:1]
+                    if (first.isdigit() or first in LIST_BULLETS) and LIST_ITEM_PATTERN.match(line):
+                        insight = LIST_MARKER_PATTERN.sub('', line)
                         if len(insight) > 20 and len(insight) < 150:
                             insights.append(insight)
                     # Look for sentences that start with key insight indicators
-                    elif any(indicator in line.lower() for indicator in ['key insight', 'important', 'crucial', 'essential', 'fundamental', 'the main point', 'the key is']):
+                    elif INSIGHT_MATCHER.search(line.lower()):
                         if len(line) > 30 and len(line) < 200:
                             insights.append(line)
         
         return insights[:5]  # Limit to 5 key insights
     
-    def _identify_controversial_topics(self, text: str) -> List[str]:
+    def _identify_controversial_topics(self, found: Set[str]) -> List[str]:
         """Identify potentially controversial topics."""
-        controversial_keywords = [
-            'politics', 'religion', 'gender', 'race', 'sexuality', 'abortion', 'gun control',
-            'immigration', 'climate change', 'vaccine', 'covid', 'trump', 'biden',
-            'lgbtq', 'transgender', 'feminism', 'conservative', 'liberal', 'democrat', 'republican'
-        ]
-        
-        text_lower = text.lower()
-        controversial_topics = []
-        
-        for keyword in controversial_keywords:
-            if keyword in text_lower:
-                controversial_topics.append(keyword)
-        
-        return controversial_topics
+        return [keyword for keyword in CONTROVERSIAL_KEYWORDS if keyword in found]
     
     def _extract_practical_applications(self, text: str) -> List[str]:
         """Extract practical applications or actionable insights."""
-        practical_indicators = [
-            'how to', 'steps to', 'ways to', 'tips for', 'best practices', 'recommendations',
-            'actionable', 'practical', 'implement', 'apply', 'use', 'utilize', 'leverage'
-        ]
-        
-        text_lower = text.lower()
         applications = []
         
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_SPLIT_PATTERN.split(text)
         for sentence in sentences:
             sentence = sentence.strip()
-            if any(indicator in sentence.lower() for indicator in practical_indicators):
-                if len(sentence) > 20 and len(sentence) < 200:
+            if len(sentence) > 20 and len(sentence) < 200:
+                if PRACTICAL_MATCHER.search(sentence.lower()):
                     applications.append(sentence)
+                    if len(applications) == 3:
+                        break
         
-        return applications[:3]  # Limit to 3 practical applications
+        return applications  # Limit to 3 practical applications
     
-    def _assess_conversation_depth(self, messages: List[Any]) -> str:
-        """Assess the depth of the conversation."""
-        total_words = sum(len(msg.text.split()) for msg in messages)
-        avg_message_length = total_words / len(messages) if messages else 0
+    def _assess_conversation_depth(self, total_words: int, message_count: int) -> str:
+        """Assess the depth of the conversation from its word and message counts."""
+        avg_message_length = total_words / message_count if message_count else 0
         
         if avg_message_length > 200:
             return 'deep'
@@ -180,6 +224,8 @@ class ConversationAnalyzer:
 class EnhancedSummarizer:
     """Enhanced summarizer with sophisticated prompt engineering."""
     
+    __slots__ = ('analyzer', 'topic_templates', 'first_title_templates', 'first_dek_templates')
+    
     def __init__(self):
         self.analyzer = ConversationAnalyzer()
         self.topic_templates = {
@@ -248,6 +294,10 @@ class EnhancedSummarizer:
                 ]
             }
         }
+        
+        # Only the first template of each kind is used, for consistency
+        self.first_title_templates = {topic: t['titles'][0] for topic, t in self.topic_templates.items()}
+        self.first_dek_templates = {topic: t['deks'][0] for topic, t in self.topic_templates.items()}
     
     def generate_title(self, analysis: Dict[str, Any], original_title: str) -> str:
         """Generate a compelling title based on analysis."""
@@ -259,10 +309,7 @@ class EnhancedSummarizer:
             return original_title[:80]  # Ensure it fits within limits
         
         # Generate based on topic
-        if primary_topic in self.topic_templates:
-            templates = self.topic_templates[primary_topic]['titles']
-        else:
-            templates = self.topic_templates['society']['titles']
+        template = self.first_title_templates.get(primary_topic) or self.first_title_templates['society']
         
         # Create subtitle based on controversial topics or key insights
         subtitle = ""
@@ -273,7 +320,6 @@ class EnhancedSummarizer:
         else:
             subtitle = "A Deep Dive"
         
-        template = templates[0]  # Use first template for consistency
         title = template.format(topic=primary_topic.title(), subtitle=subtitle)
         
         return title[:80]  # Ensure it fits within limits
@@ -283,12 +329,7 @@ class EnhancedSummarizer:
         primary_topic = analysis['primary_topic']
         key_questions = analysis['key_questions']
         
-        if primary_topic in self.topic_templates:
-            templates = self.topic_templates[primary_topic]['deks']
-        else:
-            templates = self.topic_templates['society']['deks']
-        
-        template = templates[0]  # Use first template for consistency
+        template = self.first_dek_templates.get(primary_topic) or self.first_dek_templates['society']
         dek = template.format(topic=primary_topic)
         
         # Add question if available
@@ -376,6 +417,9 @@ class EnhancedSummarizer:
         practical_applications = analysis['practical_applications']
         controversial_topics = analysis['controversial_topics']
         
+        # The top insights open and close the body as the same numbered list
+        top_insights = [f"{i}. {insight}" for i, insight in enumerate(key_insights[:3], 1)]
+        
         body_parts = []
         
         # Introduction
@@ -398,8 +442,7 @@ class EnhancedSummarizer:
         body_parts.append("## Key Discussion Points")
         body_parts.append("")
         
-        for i, insight in enumerate(key_insights[:3], 1):
-            body_parts.append(f"{i}. {insight}")
+        body_parts.extend(top_insights)
         
         body_parts.append("")
         
@@ -435,28 +478,31 @@ class EnhancedSummarizer:
         body_parts.append("Based on this discussion, here are the key takeaways:")
         body_parts.append("")
         
-        for i, insight in enumerate(key_insights[:3], 1):
-            body_parts.append(f"{i}. {insight}")
+        body_parts.extend(top_insights)
         
         return '\n'.join(body_parts)
     
     def _extract_pull_quote(self, messages: List[Any]) -> str:
         """Extract a compelling pull quote from the conversation."""
+        fallback = None
         for message in messages:
-            if len(message.text) > 50 and len(message.text) < 200:
+            text = message.text
+            if len(text) > 50 and len(text) < 200:
+                # Remember the first substantial message as a fallback
+                if fallback is None:
+                    fallback = text
+                
                 # Look for sentences that would make good pull quotes
-                sentences = message.text.split('.')
-                for sentence in sentences:
+                for sentence in text.split('.'):
                     sentence = sentence.strip()
                     if len(sentence) > 30 and len(sentence) < 150:
                         # Check if it's a good pull quote
-                        if any(indicator in sentence.lower() for indicator in ['key', 'important', 'crucial', 'essential', 'fundamental', 'the main point', 'the key is', 'what matters', 'the truth is']):
+                        if PULL_QUOTE_MATCHER.search(sentence.lower()):
                             return sentence
         
         # Fallback to any substantial message
-        for message in messages:
-            if len(message.text) > 50 and len(message.text) < 200:
-                return message.text
+        if fallback is not None:
+            return fallback
         
         return "This conversation provided valuable insights and practical guidance."
     
@@ -500,10 +546,9 @@ class EnhancedSummarizer:
         further_reading = self.generate_further_reading(analysis)
         
         # Ensure word count is within limits
-        word_count = len(body_markdown.split())
-        if word_count > 900:
+        words = body_markdown.split()
+        if len(words) > 900:
             # Truncate if too long
-            words = body_markdown.split()
             body_markdown = ' '.join(words[:900])
         
         return SubstackDraft(
@@ -516,7 +561,12 @@ class EnhancedSummarizer:
         )
 
 
+@lru_cache(maxsize=1)
+def _shared_summarizer() -> EnhancedSummarizer:
+    """Summarizer reused across calls; it keeps no per-conversation state."""
+    return EnhancedSummarizer()
+
+
 def summarize_conversation_enhanced(conversation: NormalizedConversation) -> SubstackDraft:
     """Enhanced conversation summarization."""
-    summarizer = EnhancedSummarizer()
-    return summarizer.summarize(conversation)
+    return _shared_summarizer().summarize(conversation)
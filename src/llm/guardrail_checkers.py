@@ -1,9 +1,122 @@
 """Guardrail checkers for content safety and tone."""
 
 import re
-from typing import List, Dict, Any
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Pattern, Sequence, Tuple
 from ..util.schema import SubstackDraft, GuardrailResult
 
+# Default pattern lists. Guards copy them into per-instance lists of pattern
+# strings and compile them through the caches below, so callers can still
+# extend a guard's lists with plain strings.
+
+# PII patterns that might have been missed. Their matches can overlap (a phone
+# number can also look like an SSN), so each is scanned separately.
+PII_PATTERNS = (
+    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # emails
+    r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b',  # phones
+    r'\b\d{3}[-.\s]?\d{2}[-.\s]?\d{4}\b',  # SSN
+    r'\b\d{4}[-.\s]?\d{4}[-.\s]?\d{4}[-.\s]?\d{4}\b',  # credit cards
+)
+
+# Career-sensitive content patterns
+CAREER_SENSITIVE_PATTERNS = (
+    r'\b(?:fired|terminated|laid off|let go)\b',
+    r'\b(?:fraud|scam|illegal|unethical)\b',
+    r'\b(?:lawsuit|sue|legal action)\b',
+    r'\b(?:harassment|discrimination)\b',
+    r'\b(?:bankruptcy|insolvent|default)\b'
+)
+
+# Definitive statements without qualifiers
+DEFINITIVE_PATTERNS = (
+    r'\b(?:definitely|certainly|absolutely|without doubt)\b',
+    r'\b(?:proven|established|confirmed)\b',
+    r'\b(?:always|never|all|none)\b'
+)
+
+# Softer wording substituted for definitive language in patches
+SOFTENING_REPLACEMENTS = [
+    (re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in (
+        (r'\bdefinitely\b', 'likely'),
+        (r'\bcertainly\b', 'probably'),
+        (r'\babsolutely\b', 'generally'),
+        (r'\bwithout doubt\b', 'in most cases'),
+        (r'\bproven\b', 'suggested'),
+        (r'\bestablished\b', 'indicated'),
+        (r'\bconfirmed\b', 'suggested')
+    )
+]
+
+# Inappropriate tone patterns
+CASUAL_PATTERNS = (
+    r'\b(?:lol|lmao|omg|wtf|fyi|btw)\b',
+    r'\b(?:awesome|cool|amazing|incredible|fantastic)\b',
+    r'\b(?:totally|definitely|absolutely|completely)\b',
+    r'\b(?:you guys|y\'all|folks)\b'
+)
+
+MARKETING_PATTERNS = (
+    r'\b(?:revolutionary|game-changing|breakthrough|cutting-edge)\b',
+    r'\b(?:must-have|essential|critical|vital)\b',
+    r'\b(?:unlock|leverage|optimize|maximize)\b',
+    r'\b(?:transform|disrupt|innovate|pioneer)\b'
+)
+
+# Issue prefixes for each word-list category
+CAREER_SENSITIVE_LABEL = "Career-sensitive content"
+UNVERIFIED_CLAIM_LABEL = "Potentially unverified claim"
+CASUAL_LABEL = "Casual language detected"
+MARKETING_LABEL = "Marketing language detected"
+
+
+@lru_cache(maxsize=None)
+def _compiled(pattern: str) -> Pattern:
+    """Case-insensitive compiled form of a pattern string."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _fused_pattern(patterns: Tuple[str, ...]) -> Pattern:
+    """One case-insensitive alternation with each pattern in its own named group."""
+    alternation = '|'.join(f'(?P<g{i}>{pattern})' for i, pattern in enumerate(patterns))
+    return re.compile(alternation, re.IGNORECASE)
+
+
+def _word_list_issues(
+    categories: List[Tuple[str, Sequence[str], Tuple[str, ...]]], text: str
+) -> List[str]:
+    """Report the matches of several labelled pattern lists.
+    
+    Each category is a label, the guard's pattern list and that list's
+    module default. Issues come out in category and pattern order, one per
+    matching pattern. While every list still equals its default, the lists
+    are scanned together in one fused alternation; that is only exact for
+    the built-in word lists, whose matches cannot overlap and which use no
+    groups or inline flags. Lists a caller has changed are scanned one
+    pattern at a time.
+    """
+    issues = []
+    
+    if all(tuple(patterns) == defaults for _, patterns, defaults in categories):
+        fused = tuple(pattern for _, patterns, _ in categories for pattern in patterns)
+        counts = Counter(match.lastgroup for match in _fused_pattern(fused).finditer(text))
+        index = 0
+        for label, patterns, _ in categories:
+            for pattern in patterns:
+                count = counts[f'g{index}']
+                if count:
+                    issues.append(f"{label}: {count} matches of '{pattern}'")
+                index += 1
+    else:
+        for label, patterns, _ in categories:
+            for pattern in patterns:
+                matches = _compiled(pattern).findall(text)
+                if matches:
+                    issues.append(f"{label}: {len(matches)} matches of '{pattern}'")
+    
+    return issues
+
 
 class ContentGuard:
     """Content safety and legal compliance checker."""
@@ -11,29 +124,16 @@ class ContentGuard:
     def __init__(self, blocked_phrases: List[str] = None):
         self.blocked_phrases = blocked_phrases or []
         
-        # PII patterns that might have been missed
-        self.pii_patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # emails
-            r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b',  # phones
-            r'\b\d{3}[-.\s]?\d{2}[-.\s]?\d{4}\b',  # SSN
-            r'\b\d{4}[-.\s]?\d{4}[-.\s]?\d{4}[-.\s]?\d{4}\b',  # credit cards
-        ]
-        
-        # Career-sensitive content patterns
-        self.career_sensitive = [
-            r'\b(?:fired|terminated|laid off|let go)\b',
-            r'\b(?:fraud|scam|illegal|unethical)\b',
-            r'\b(?:lawsuit|sue|legal action)\b',
-            r'\b(?:harassment|discrimination)\b',
-            r'\b(?:bankruptcy|insolvent|default)\b'
-        ]
+        # Pattern strings, copied so each guard can be extended on its own
+        self.pii_patterns = list(PII_PATTERNS)
+        self.career_sensitive = list(CAREER_SENSITIVE_PATTERNS)
     
     def check_pii_leakage(self, text: str) -> List[str]:
         """Check for remaining PII after redaction."""
         issues = []
         
         for pattern in self.pii_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = _compiled(pattern).findall(text)
             if matches:
                 issues.append(f"PII detected: {len(matches)} matches of pattern {pattern}")
         
@@ -52,32 +152,16 @@ class ContentGuard:
     
     def check_career_sensitive_content(self, text: str) -> List[str]:
         """Check for career-sensitive content."""
-        issues = []
-        
-        for pattern in self.career_sensitive:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                issues.append(f"Career-sensitive content: {len(matches)} matches of '{pattern}'")
-        
-        return issues
+        return _word_list_issues(
+            [(CAREER_SENSITIVE_LABEL, self.career_sensitive, CAREER_SENSITIVE_PATTERNS)], text
+        )
     
     def check_unverified_claims(self, text: str) -> List[str]:
         """Check for unverified claims presented as facts."""
-        issues = []
-        
         # Look for definitive statements without qualifiers
-        definitive_patterns = [
-            r'\b(?:definitely|certainly|absolutely|without doubt)\b',
-            r'\b(?:proven|established|confirmed)\b',
-            r'\b(?:always|never|all|none)\b'
-        ]
-        
-        for pattern in definitive_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                issues.append(f"Potentially unverified claim: {len(matches)} matches of '{pattern}'")
-        
-        return issues
+        return _word_list_issues(
+            [(UNVERIFIED_CLAIM_LABEL, DEFINITIVE_PATTERNS, DEFINITIVE_PATTERNS)], text
+        )
     
     def check_content(self, draft: SubstackDraft) -> GuardrailResult:
         """Run all content checks."""
@@ -96,6 +180,7 @@ class ContentGuard:
         # Run all checks
         issues.extend(self.check_pii_leakage(full_text))
         issues.extend(self.check_blocked_phrases(full_text))
+        
         issues.extend(self.check_career_sensitive_content(full_text))
         issues.extend(self.check_unverified_claims(full_text))
         
@@ -116,25 +201,15 @@ class ContentGuard:
         
         # Remove PII
         for pattern in self.pii_patterns:
-            patched_text = re.sub(pattern, '[redacted]', patched_text, flags=re.IGNORECASE)
+            patched_text = _compiled(pattern).sub('[redacted]', patched_text)
         
         # Remove blocked phrases
         for phrase in self.blocked_phrases:
             patched_text = patched_text.replace(phrase, '[removed]')
         
         # Soften definitive language
-        replacements = {
-            r'\bdefinitely\b': 'likely',
-            r'\bcertainly\b': 'probably',
-            r'\babsolutely\b': 'generally',
-            r'\bwithout doubt\b': 'in most cases',
-            r'\bproven\b': 'suggested',
-            r'\bestablished\b': 'indicated',
-            r'\bconfirmed\b': 'suggested'
-        }
-        
-        for pattern, replacement in replacements.items():
-            patched_text = re.sub(pattern, replacement, patched_text, flags=re.IGNORECASE)
+        for pattern, replacement in SOFTENING_REPLACEMENTS:
+            patched_text = pattern.sub(replacement, patched_text)
         
         return patched_text
 
@@ -146,20 +221,9 @@ class ToneGuard:
         self.target_words = target_words
         self.hard_cap_words = hard_cap_words
         
-        # Inappropriate tone patterns
-        self.casual_patterns = [
-            r'\b(?:lol|lmao|omg|wtf|fyi|btw)\b',
-            r'\b(?:awesome|cool|amazing|incredible|fantastic)\b',
-            r'\b(?:totally|definitely|absolutely|completely)\b',
-            r'\b(?:you guys|y\'all|folks)\b'
-        ]
-        
-        self.marketing_patterns = [
-            r'\b(?:revolutionary|game-changing|breakthrough|cutting-edge)\b',
-            r'\b(?:must-have|essential|critical|vital)\b',
-            r'\b(?:unlock|leverage|optimize|maximize)\b',
-            r'\b(?:transform|disrupt|innovate|pioneer)\b'
-        ]
+        # Pattern strings, copied so each guard can be extended on its own
+        self.casual_patterns = list(CASUAL_PATTERNS)
+        self.marketing_patterns = list(MARKETING_PATTERNS)
     
     def check_length(self, draft: SubstackDraft) -> List[str]:
         """Check word count compliance."""
@@ -179,21 +243,11 @@ class ToneGuard:
     
     def check_tone_patterns(self, text: str) -> List[str]:
         """Check for inappropriate tone."""
-        issues = []
-        
-        # Check for casual language
-        for pattern in self.casual_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                issues.append(f"Casual language detected: {len(matches)} matches of '{pattern}'")
-        
-        # Check for marketing speak
-        for pattern in self.marketing_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                issues.append(f"Marketing language detected: {len(matches)} matches of '{pattern}'")
-        
-        return issues
+        # Check for casual language and marketing speak in one scan
+        return _word_list_issues([
+            (CASUAL_LABEL, self.casual_patterns, CASUAL_PATTERNS),
+            (MARKETING_LABEL, self.marketing_patterns, MARKETING_PATTERNS),
+        ], text)
     
     def check_structure(self, draft: SubstackDraft) -> List[str]:
         """Check content structure."""
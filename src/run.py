@@ -114,12 +114,11 @@ class Chat2SubstackPipeline:
     
     def summarize_conversation(self, conversation: NormalizedConversation, content_type: str = "auto") -> SubstackDraft:
         """Summarize conversation to Substack draft using judge-driven system."""
-        from .analysis.anchors import AnchorExtractor
+        from .analysis.anchors import extract_anchors_cached
         from .routing.router import DeterministicRouter
         from .validate.judge import ContentJudge
         
         # Extract anchors from conversation
-        anchor_extractor = AnchorExtractor()
         conversation_dict = {
             'messages': [
                 {'content': msg.text, 'role': msg.role} 
@@ -128,7 +127,7 @@ class Chat2SubstackPipeline:
             'title_hint': getattr(conversation, 'title_hint', 'Untitled Conversation')
         }
         
-        anchors = anchor_extractor.extract_anchors(conversation_dict['messages'])
+        anchors = extract_anchors_cached(conversation_dict['messages'])
         
         # Route content type
         router = DeterministicRouter()
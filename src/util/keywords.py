@@ -0,0 +1,53 @@
+"""Single-pass literal keyword matching."""
+
+import re
+from typing import Dict, Iterable, List, Set
+
+
+class KeywordMatcher:
+    """Finds which of a fixed set of literal keywords occur in a text.
+
+    All keywords are compiled into one zero-width alternation, longest first,
+    so a single scan reports the longest keyword starting at each position.
+    Any shorter keyword starting at the same position is necessarily a prefix
+    of that match, so it is recovered from a precomputed prefix table. The
+    result is the same as testing ``keyword in text`` for every keyword, even
+    when keywords overlap (e.g. ``git`` / ``github`` or ``llama`` / ``ollama``).
+    """
+
+    def __init__(self, keywords: Iterable[str], ignore_case: bool = False):
+        self.keywords = list(dict.fromkeys(keywords))
+        self.ignore_case = ignore_case
+
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        flags = re.IGNORECASE if ignore_case else 0
+        if ordered:
+            self._pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))', flags)
+        else:
+            # An empty alternation would match everywhere; this never matches
+            self._pattern = re.compile('(?!)')
+
+        # Every keyword that is a prefix of another keyword (including itself)
+        self._prefixes: Dict[str, List[str]] = {}
+        for keyword in self.keywords:
+            key = self._normalize(keyword)
+            self._prefixes[key] = [
+                other for other in self.keywords
+                if key.startswith(self._normalize(other))
+            ]
+
+    def _normalize(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def findall(self, text: str) -> Set[str]:
+        """Return the set of keywords that occur anywhere in the text."""
+        found: Set[str] = set()
+        for match in self._pattern.finditer(text):
+            found.update(self._prefixes[self._normalize(match.group(1))])
+            if len(found) == len(self.keywords):
+                break
+        return found
+
+    def search(self, text: str) -> bool:
+        """Return True if any keyword occurs in the text."""
+        return self._pattern.search(text) is not None
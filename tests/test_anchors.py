@@ -0,0 +1,32 @@
+"""Tests for anchor extraction."""
+
+from src.analysis.anchors import AnchorExtractor, extract_anchors_cached
+
+
+MESSAGES = [
+    {'role': 'user', 'content': 'We decided to run the model with ollama.'},
+    {'role': 'assistant', 'content': '$ ollama run llama3\nThen call it through litellm with curl.'},
+]
+
+
+class TestExtractAnchorsCached:
+    """Test the shared anchor cache."""
+
+    def test_cache_hit_matches_fresh_extraction(self):
+        """A repeated call returns the same anchors as a fresh extraction."""
+        expected = AnchorExtractor().extract_anchors(MESSAGES)
+
+        assert extract_anchors_cached(MESSAGES) == expected
+        assert extract_anchors_cached([dict(msg) for msg in MESSAGES]) == expected
+
+    def test_mutating_results_does_not_corrupt_cache(self):
+        """Changes to returned anchors are not seen by later callers."""
+        expected = AnchorExtractor().extract_anchors(MESSAGES)
+
+        anchors = extract_anchors_cached(MESSAGES)
+        for anchor in anchors:
+            anchor.tags.append('mutated')
+            anchor.text = 'mutated'
+        anchors.clear()
+
+        assert extract_anchors_cached(MESSAGES) == expected
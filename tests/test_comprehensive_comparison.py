@@ -0,0 +1,124 @@
+"""Tests for the comprehensive summarizer comparison."""
+
+import json
+import threading
+
+from src.llm.comprehensive_comparison import ComprehensiveComparison
+from src.llm.journal_summarizer import summarize_conversation_journal
+from src.util.schema import NormalizedConversation, SourceInfo, Message, SubstackDraft
+
+
+class TestSummarizers:
+    """Test the name to summarizer mapping."""
+
+    def test_entry_points_resolve_to_functions(self, tmp_path):
+        """Looking up a name imports and returns the summarizer function."""
+        comparison = ComprehensiveComparison(tmp_path)
+
+        assert comparison.summarizers["journal"] is summarize_conversation_journal
+
+    def test_assigned_function_replaces_entry_point(self, tmp_path):
+        """A function assigned to a name is returned as is and keeps its place."""
+        comparison = ComprehensiveComparison(tmp_path)
+        names = list(comparison.summarizers)
+
+        comparison.summarizers["journal"] = len
+
+        assert comparison.summarizers["journal"] is len
+        assert list(comparison.summarizers) == names
+
+
+class TestRunComprehensiveComparison:
+    """Test running every summarizer and saving their drafts."""
+
+    def test_summarizers_run_in_order_on_calling_thread(self, tmp_path):
+        """Summarizers run sequentially on the caller's thread and every draft is saved."""
+        comparison = ComprehensiveComparison(tmp_path)
+        calls = []
+
+        def make_summarizer(name):
+            def summarize(conversation):
+                calls.append((name, threading.current_thread()))
+                return SubstackDraft(
+                    title=f"{name} title",
+                    dek="Test dek",
+                    tldr=["Point 1", "Point 2", "Point 3"],
+                    tags=["test", "draft", "comparison"],
+                    body_markdown=f"Body written by {name}."
+                )
+            return summarize
+
+        for name in comparison.summarizers:
+            comparison.summarizers[name] = make_summarizer(name)
+
+        conversation = NormalizedConversation(
+            id="2024-01-01T00:00:00Z",
+            source=SourceInfo(type="manual_text", path="test.txt"),
+            messages=[Message(role="user", text="How should I configure the CLI?")]
+        )
+
+        report_path = comparison.run_comprehensive_comparison(conversation)
+
+        assert [name for name, _ in calls] == list(comparison.summarizers)
+        assert all(thread is threading.current_thread() for _, thread in calls)
+        for name in comparison.summarizers:
+            draft_text = (tmp_path / f"{name}_draft.md").read_text(encoding='utf-8')
+            assert f"# {name} title" in draft_text
+        assert report_path.exists()
+
+        stats = json.loads((tmp_path / "summary_statistics.json").read_text(encoding='utf-8'))
+        assert list(stats["word_counts"]) == list(comparison.summarizers)
+        assert stats["failed_summarizers"] == 0
+
+    def test_failed_draft_write_is_reported_as_error(self, tmp_path):
+        """A draft that cannot be written is reported like a failed summarizer."""
+        comparison = ComprehensiveComparison(tmp_path)
+        for name in comparison.summarizers:
+            comparison.summarizers[name] = lambda conversation, name=name: SubstackDraft(
+                title=f"{name} title",
+                dek="Test dek",
+                tldr=["Point 1", "Point 2", "Point 3"],
+                tags=["test", "draft", "comparison"],
+                body_markdown="Body."
+            )
+        # A directory in the way makes the journal draft write fail
+        (tmp_path / "journal_draft.md").mkdir()
+        conversation = NormalizedConversation(
+            id="2024-01-01T00:00:00Z",
+            source=SourceInfo(type="manual_text", path="test.txt"),
+            messages=[Message(role="user", text="How should I configure the CLI?")]
+        )
+
+        comparison.run_comprehensive_comparison(conversation)
+
+        stats = json.loads((tmp_path / "summary_statistics.json").read_text(encoding='utf-8'))
+        assert stats["failed_summarizers"] == 1
+        assert "journal" not in stats["word_counts"]
+
+
+class TestEvaluateDraftQuality:
+    """Test the per-draft quality evaluation."""
+
+    def test_short_structured_draft_keeps_its_flags(self, tmp_path):
+        """Short drafts still report structure and technical details."""
+        comparison = ComprehensiveComparison(tmp_path)
+        draft = SubstackDraft(
+            title="Configuring the CLI",
+            dek="Test dek",
+            tldr=["Point 1", "Point 2", "Point 3"],
+            tags=["test", "draft", "comparison"],
+            body_markdown=(
+                "## The Problem\nThe config was wrong.\n\n"
+                "## The Approach\nEdit the yaml.\n\n"
+                "## The Results\nIt works."
+            )
+        )
+
+        metrics = comparison._evaluate_draft_quality(draft, "journal")
+
+        assert metrics["word_count"] < 50
+        assert metrics["has_structure"]
+        assert metrics["has_technical_details"]
+        assert metrics["style_appropriate"]
+        assert not metrics["has_narrative_flow"]
+        assert metrics["overall_quality"] == "Good"
@@ -0,0 +1,100 @@
+"""Tests for the comprehensive technical journal summarizer."""
+
+import multiprocessing
+
+from src.llm.comprehensive_summarizer import (
+    ComprehensiveTechnicalJournalSummarizer, summarize_conversations_comprehensive
+)
+from src.util.schema import NormalizedConversation, SourceInfo, Message
+
+
+class TestExtractComprehensiveContext:
+    """Test whole-conversation context extraction."""
+
+    def test_commands_found_without_backticks(self):
+        """Commands are still extracted from text with no inline or fenced code."""
+        conversation = NormalizedConversation(
+            id="2024-01-01T00:00:00Z",
+            source=SourceInfo(type="manual_text", path="test.txt"),
+            messages=[
+                Message(role="user", text="How do I add Sentry?"),
+                Message(role="assistant", text="Run pip install sentry-sdk and restart the CLI."),
+            ]
+        )
+
+        context = ComprehensiveTechnicalJournalSummarizer().extract_comprehensive_context(
+            conversation
+        )
+
+        assert context['code_examples'] == ["pip install sentry-sdk and restart the CLI."]
+
+    def test_short_assistant_messages_give_empty_buckets(self):
+        """Assistant replies too short for any extractor leave their buckets empty."""
+        conversation = NormalizedConversation(
+            id="2024-01-01T00:00:00Z",
+            source=SourceInfo(type="manual_text", path="test.txt"),
+            messages=[
+                Message(role="user", text="I decided to use Docker for deployment."),
+                Message(role="assistant", text="Sounds good."),
+            ]
+        )
+
+        context = ComprehensiveTechnicalJournalSummarizer().extract_comprehensive_context(
+            conversation
+        )
+
+        assert context['implementation_details'] == []
+        assert context['results_achieved'] == []
+
+
+class TestSummarizeConversationsComprehensive:
+    """Test batch summarization across worker processes."""
+
+    def test_batch_matches_sequential_summaries(self):
+        """Spawned workers return the same drafts as sequential calls, in input order."""
+        source = SourceInfo(type="manual_text", path="test.txt")
+        sentry_messages = [
+            Message(role="user", text=(
+                "I want to integrate Sentry with my Python CLI. "
+                "The problem is that errors are lost."
+            )),
+            Message(role="assistant", text=(
+                "Here's how to set it up. First, run `pip install sentry-sdk`.\n\n"
+                "```python\nimport sentry_sdk\n"
+                "sentry_sdk.init(dsn='https://key@sentry.io/1')\n```\n\n"
+                "The key insight is that you should initialize Sentry before anything else. "
+                "I decided to use environment variables for the DSN."
+            )),
+            Message(role="user", text="That worked! Next I need to add performance monitoring."),
+        ]
+        conversations = [
+            NormalizedConversation(
+                id="2024-01-01T00:00:00Z", source=source,
+                title_hint="Sentry integration", messages=sentry_messages
+            ),
+            NormalizedConversation(
+                id="2024-01-01T00:00:00Z", source=source, title_hint="Ollama setup",
+                messages=[
+                    Message(role="user", text=(
+                        "How do I run Ollama locally with litellm? The setup keeps failing."
+                    )),
+                    Message(role="assistant", text=(
+                        "You can try running `ollama serve` first, then configure litellm."
+                    )),
+                ]
+            ),
+            NormalizedConversation(
+                id="2024-01-01T00:00:00Z", source=source,
+                title_hint="Third conversation", messages=sentry_messages
+            ),
+        ]
+
+        drafts = summarize_conversations_comprehensive(
+            conversations, max_workers=2, mp_context=multiprocessing.get_context('spawn')
+        )
+
+        summarizer = ComprehensiveTechnicalJournalSummarizer()
+        expected = [summarizer.summarize(conversation) for conversation in conversations]
+        assert [draft.model_dump() for draft in drafts] == [
+            draft.model_dump() for draft in expected
+        ]
@@ -0,0 +1,230 @@
+"""Tests for the critique summarizer."""
+
+from src.llm.critique_summarizer import CritiqueSummarizer
+
+
+class TestNonAsciiInput:
+    """Test cue matching next to non-ASCII characters."""
+
+    def test_cue_touching_non_ascii_letter_is_not_a_word(self):
+        """A cue glued to a non-ASCII letter is skipped for the next whole-word cue."""
+        conversation = {
+            'title_hint': 'Units',
+            'messages': [{'role': 'user', 'content': "ÉI ARGUE that Ünits matter. I think so."}]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert draft.title == "My Take: "
+        assert draft.tldr[0] == "**Thesis:** I think"
+        assert 'perspective' in draft.tags
+        assert 'argument' not in draft.tags
+
+    def test_glued_cue_falls_back_to_opinion_anchor(self):
+        """With no whole-word cue the thesis comes from the opinion anchor."""
+        conversation = {
+            'title_hint': 'Resume',
+            'messages': [{'role': 'user', 'content': "résuméI think this matters."}]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert draft.tldr[0] == "**Thesis:** The main argument is that think"
+
+    def test_case_insensitive_letter_equivalents_match_cues(self):
+        """Letters that match ASCII case-insensitively still form cues."""
+        conversation = {
+            'title_hint': 'Dotted I',
+            'messages': [{'role': 'user', 'content': "Well, İ argue that this is right."}]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert draft.tldr[0] == "**Thesis:** İ argue"
+
+
+class TestThesisAndContext:
+    """Test thesis and context extraction, including their fallbacks."""
+
+    def test_thesis_from_explicit_cue(self):
+        """An explicit stance cue becomes the thesis."""
+        conversation = {
+            'title_hint': 'Remote work',
+            'messages': [{'role': 'user', 'content': "Remote work is here. I believe it helps."}]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert draft.tldr[0] == "**Thesis:** I believe"
+
+    def test_later_higher_ranked_cue_wins(self):
+        """A later top-priority cue beats an earlier lower-priority one."""
+        conversation = {
+            'title_hint': 'Plans',
+            'messages': [
+                {'role': 'user', 'content': "I agree with the plan."},
+                {'role': 'assistant', 'content': "Later I think it will work."},
+            ]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert draft.tldr[0] == "**Thesis:** I think"
+
+    def test_thesis_falls_back_to_opinion_anchor(self):
+        """Without a stance cue the first opinion anchor is used."""
+        conversation = {
+            'title_hint': 'Plans',
+            'messages': [{'role': 'user', 'content': "They agree on most of the plan."}]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert draft.tldr[0] == "**Thesis:** The main argument is that agree"
+
+    def test_thesis_default(self):
+        """Without cues or opinion anchors the default thesis is used."""
+        conversation = {
+            'title_hint': 'Greeting',
+            'messages': [{'role': 'user', 'content': "Hello world. Second sentence here."}]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert draft.tldr[0] == (
+            "**Thesis:** This discussion presents a critical perspective on the topic"
+        )
+
+    def test_context_prefers_first_group_cue(self):
+        """Context cues in the first group outrank earlier second-group cues."""
+        conversation = {
+            'title_hint': 'Budgets',
+            'messages': [
+                {'role': 'user', 'content': "The problem is scope. Regarding budgets, we are fine."}
+            ]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert draft.dek.startswith("A critical examination of regarding, arguing that")
+
+    def test_context_falls_back_to_first_two_sentences(self):
+        """Without context cues the first two sentences are used."""
+        conversation = {
+            'title_hint': 'Greeting',
+            'messages': [
+                {'role': 'user', 'content': "Hello world. Second sentence here. Third one."}
+            ]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert draft.dek.startswith(
+            "A critical examination of hello world.  second sentence here., arguing that"
+        )
+
+    def test_context_fallback_without_periods(self):
+        """Text without any period is used whole."""
+        conversation = {
+            'title_hint': 'Note',
+            'messages': [{'role': 'user', 'content': "No periods at all"}]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert draft.dek.startswith("A critical examination of no periods at all., arguing that")
+
+
+class TestArgumentsCounterpointsAndStakes:
+    """Test supporting and opposing material and the stakes."""
+
+    def test_arguments_come_from_decision_anchors(self):
+        """Short cue matches are dropped; decision anchors become arguments."""
+        conversation = {
+            'title_hint': 'Approach',
+            'messages': [
+                {'role': 'user',
+                 'content': "We decided to use a new approach because it is simpler."}
+            ]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert "**Arguments:** 2 key points" in draft.tldr
+        assert "1. decided: We decided to use a new approach" in draft.body_markdown
+        assert "2. approach: We decided to use a new approach" in draft.body_markdown
+
+    def test_counterpoints_default_when_cues_are_short(self):
+        """Counterpoint cues alone are too short, so the defaults are used."""
+        conversation = {
+            'title_hint': 'Plans',
+            'messages': [
+                {'role': 'user', 'content': "However, on the other hand it could fail."}
+            ]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert "**Counterpoints:** 3 opposing views" in draft.tldr
+        assert "Critics might argue that this perspective is too narrow" in draft.body_markdown
+
+    def test_stakes_use_highest_priority_term(self):
+        """A later 'risk' sentence beats an earlier 'impact' sentence."""
+        conversation = {
+            'title_hint': 'Remote work',
+            'messages': [
+                {'role': 'user', 'content': "The impact is large. The main risk is burnout."}
+            ]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert "**Stakes:** risk is burnout...." in draft.tldr
+        assert "## Stakes\nrisk is burnout." in draft.body_markdown
+
+    def test_stakes_default(self):
+        """Without consequence terms the default stakes are used."""
+        conversation = {
+            'title_hint': 'Greeting',
+            'messages': [{'role': 'user', 'content': "Hello world."}]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert "**Stakes:** The implications of this perspective affect how we..." in draft.tldr
+
+
+class TestTitleAndTags:
+    """Test the title prefix and tag selection."""
+
+    def test_title_prefix_follows_stance_verb(self):
+        """The stance verb in the thesis picks the title prefix."""
+        cases = [
+            ("I argue remote work helps.", "Critical Analysis: "),
+            ("I think remote work helps.", "My Take: "),
+            ("I believe remote work helps.", "Opinion: "),
+            ("My position is that remote work helps.", "Critical Analysis: My position"),
+        ]
+
+        for text, title in cases:
+            conversation = {
+                'title_hint': 'Remote work',
+                'messages': [{'role': 'user', 'content': text}]
+            }
+            assert CritiqueSummarizer().summarize_conversation(conversation).title == title
+
+    def test_tags_from_thesis_and_opinion_anchors(self):
+        """Stance and opinion anchor tags follow the base tags, capped at six."""
+        conversation = {
+            'title_hint': 'Remote work',
+            'messages': [
+                {'role': 'user',
+                 'content': "I think remote work helps. I agree it is hard to measure."},
+                {'role': 'assistant', 'content': "The main risk is isolation."},
+            ]
+        }
+
+        draft = CritiqueSummarizer().summarize_conversation(conversation)
+
+        assert draft.title == "My Take: "
+        assert draft.tags == ['critique', 'opinion', 'analysis', 'perspective', 'think', 'agree']
@@ -0,0 +1,105 @@
+"""Tests for the decision-centric technical journal summarizer."""
+
+from src.llm.decision_centric_journal import (
+    CLOSING_MARKDOWN, COMMANDS_MARKDOWN, SHIPPING_DECISIONS_MARKDOWN, TLDR_MARKDOWN,
+    DecisionCentricJournalSummarizer
+)
+
+
+TECH_CONVERSATION = {
+    'title_hint': 'Local LLM setup',
+    'messages': [
+        {'role': 'user', 'content': 'We run ollama and litellm inside docker, and report errors to sentry.'},
+        {'role': 'assistant', 'content': 'Start with `ollama serve`, then point litellm at it.'},
+    ]
+}
+
+
+class TestCreateTags:
+    """Test tag selection for journal drafts."""
+
+    def test_area_tags_survive_the_cap(self):
+        """Stack and area tags rank ahead of the generic ones."""
+        summarizer = DecisionCentricJournalSummarizer()
+        narrative = {
+            'technical_stack': ['Ollama', 'LiteLLM', 'Docker', 'Sentry'],
+            'decisions_by_area': {'Tooling': [], 'Deployment': [], 'Testing': []},
+        }
+
+        assert summarizer._create_tags(narrative) == [
+            'technical-journal', 'ollama', 'litellm', 'docker', 'tooling', 'deployment'
+        ]
+
+    def test_generic_tags_fill_short_lists(self):
+        """Without stack or areas the generic tags keep the minimum of three."""
+        assert DecisionCentricJournalSummarizer()._create_tags({}) == [
+            'technical-journal', 'engineering', 'development'
+        ]
+
+    def test_draft_tags_include_areas(self):
+        """Full drafts carry their decision areas as tags."""
+        draft = DecisionCentricJournalSummarizer().summarize_conversation(TECH_CONVERSATION)
+
+        assert len(draft.tags) == 6
+        assert 'engineering' not in draft.tags
+
+
+class TestExtractProblemContext:
+    """Test problem context selection."""
+
+    def test_mutating_context_does_not_leak(self):
+        """Changes to a returned context are not seen by later calls."""
+        summarizer = DecisionCentricJournalSummarizer()
+
+        for tokens in [{'ollama'}, set()]:
+            expected = dict(summarizer._extract_problem_context(tokens))
+            context = summarizer._extract_problem_context(tokens)
+            context['problem'] = 'mutated'
+            context.clear()
+
+            assert summarizer._extract_problem_context(tokens) == expected
+
+
+class TestStaticFastPath:
+    """Test summarize_conversation(..., full=False)."""
+
+    PLAIN_CONVERSATION = {
+        'title_hint': 'Weekend notes',
+        'messages': [
+            {'role': 'user', 'content': 'Notes from the weekend.'},
+            {'role': 'assistant', 'content': 'Thanks for sharing them.'},
+        ]
+    }
+
+    def test_matches_full_draft_when_nothing_is_extracted(self):
+        """With nothing for the scans to find, both modes give the same draft."""
+        summarizer = DecisionCentricJournalSummarizer()
+
+        full = summarizer.summarize_conversation(self.PLAIN_CONVERSATION)
+        fast = summarizer.summarize_conversation(self.PLAIN_CONVERSATION, full=False)
+
+        assert fast.title == full.title
+        assert fast.dek == full.dek
+        assert fast.tldr == full.tldr
+        assert fast.tags == full.tags
+        assert fast.body_markdown == full.body_markdown
+
+    def test_ignores_conversation_content(self):
+        """The fast path gives the same draft whatever the conversation mentions."""
+        summarizer = DecisionCentricJournalSummarizer()
+
+        plain = summarizer.summarize_conversation(self.PLAIN_CONVERSATION, full=False)
+        tech = summarizer.summarize_conversation(TECH_CONVERSATION, full=False)
+
+        assert tech.model_dump() == plain.model_dump()
+
+    def test_static_sections_match_full_draft(self):
+        """Static body sections are identical in both modes."""
+        summarizer = DecisionCentricJournalSummarizer()
+
+        full = summarizer.summarize_conversation(TECH_CONVERSATION)
+        fast = summarizer.summarize_conversation(TECH_CONVERSATION, full=False)
+
+        for section in (TLDR_MARKDOWN, COMMANDS_MARKDOWN, SHIPPING_DECISIONS_MARKDOWN, CLOSING_MARKDOWN):
+            assert section in full.body_markdown
+            assert section in fast.body_markdown
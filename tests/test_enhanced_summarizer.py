@@ -0,0 +1,32 @@
+"""Tests for the enhanced summarizer."""
+
+from src.llm.enhanced_summarizer import summarize_conversation_enhanced
+from src.util.schema import NormalizedConversation, SourceInfo, Message
+
+
+class TestQuestionExtraction:
+    """Test that extracted questions stay out of the dek and intro."""
+
+    def test_dek_and_intro_stay_free_of_raw_questions(self):
+        """Multi-line questions never leak into the dek or intro."""
+        conversation = NormalizedConversation(
+            id="2024-01-01T00:00:00Z",
+            source=SourceInfo(type="manual_text", path="test.txt"),
+            title_hint="Questions about research",
+            messages=[
+                Message(role="user", text=(
+                    "\\\n\\\nWhat if research on learning could be applied in every school?"
+                    "\n\nHow?"
+                )),
+                Message(role="assistant", text=(
+                    "Research on learning shows that practice and feedback both matter. " * 5
+                )),
+            ]
+        )
+
+        draft = summarize_conversation_enhanced(conversation)
+
+        assert "\n" not in draft.dek
+        assert "\\" not in draft.dek
+        assert "We explore:" not in draft.dek
+        assert "key questions like" not in draft.body_markdown
@@ -106,6 +106,38 @@ class TestContentGuard:
         assert not result.ok
         assert result.patch is not None
         assert "[redacted]" in result.patch
+    
+    def test_pattern_lists_are_per_guard(self):
+        """String patterns added to one guard take effect only on that guard."""
+        guard = ContentGuard()
+        other = ContentGuard()
+        
+        guard.career_sensitive.append(r'\b(?:demoted)\b')
+        guard.pii_patterns.append(r'\bACCT-\d{6}\b')
+        
+        text = "I was demoted after sharing acct-123456"
+        assert any("demoted" in issue for issue in guard.check_career_sensitive_content(text))
+        assert any("ACCT" in issue for issue in guard.check_pii_leakage(text))
+        assert other.check_career_sensitive_content(text) == []
+        assert other.check_pii_leakage(text) == []
+    
+    def test_check_content_uses_overridden_checks(self):
+        """Subclass overrides of the word-list checks are honoured."""
+        class LenientGuard(ContentGuard):
+            def check_unverified_claims(self, text):
+                return []
+        
+        draft = SubstackDraft(
+            title="Test Article",
+            dek="Test dek",
+            tldr=["Point 1", "Point 2", "Point 3"],
+            tags=["test", "guardrails", "content"],
+            body_markdown="This is definitely proven, and the company was sued for fraud"
+        )
+        
+        issues = LenientGuard().check_content(draft).issues
+        assert any("Career-sensitive content" in issue for issue in issues)
+        assert not any("Potentially unverified claim" in issue for issue in issues)
 
 
 class TestToneGuard:
@@ -261,6 +293,40 @@ class TestToneGuard:
         result = guard.check_tone(draft)
         assert result.ok
         assert len(result.issues) == 0
+    
+    def test_pattern_lists_are_per_guard(self):
+        """String patterns added to one guard take effect only on that guard."""
+        guard = ToneGuard()
+        other = ToneGuard()
+        
+        guard.casual_patterns.append(r'\b(?:gonna|wanna)\b')
+        
+        text = "We're gonna ship it"
+        assert guard.check_tone_patterns(text) == [
+            "Casual language detected: 1 matches of '\\b(?:gonna|wanna)\\b'"
+        ]
+        assert other.check_tone_patterns(text) == []
+    
+    def test_appended_overlapping_pattern_is_reported(self):
+        """A pattern overlapping a built-in word is reported alongside it."""
+        guard = ToneGuard()
+        guard.casual_patterns.append(r'\bcool stuff\b')
+        
+        issues = guard.check_tone_patterns("Some cool stuff here")
+        
+        assert any("'\\b(?:awesome|cool" in issue for issue in issues)
+        assert "Casual language detected: 1 matches of '\\bcool stuff\\b'" in issues
+    
+    def test_appended_inline_flag_and_backreference_patterns(self):
+        """Appended patterns keep their own flags and groups."""
+        guard = ToneGuard()
+        guard.marketing_patterns.append(r'(?i)\bsynergy\b')
+        guard.marketing_patterns.append(r'\b(\w+) \1\b')
+        
+        issues = guard.check_tone_patterns("Synergy synergy everywhere")
+        
+        assert "Marketing language detected: 2 matches of '(?i)\\bsynergy\\b'" in issues
+        assert "Marketing language detected: 1 matches of '\\b(\\w+) \\1\\b'" in issues
 
 
 class TestGuardrailFunctions:
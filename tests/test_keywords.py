@@ -0,0 +1,44 @@
+"""Tests for single-pass keyword matching."""
+
+from src.util.keywords import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test KeywordMatcher against plain substring checks."""
+
+    def test_matches_substring_semantics(self):
+        """Every keyword reported is exactly those with `keyword in text`."""
+        keywords = ['git', 'github', 'github actions', 'llama', 'ollama', 'api', 'rest', 'ci/cd']
+        matcher = KeywordMatcher(keywords)
+
+        for text in [
+            "we use github actions with ollama",
+            "a rapid interesting ci/cd setup",
+            "nothing relevant here",
+            "",
+        ]:
+            assert matcher.findall(text) == {k for k in keywords if k in text}
+
+    def test_overlapping_keywords(self):
+        """Overlapping and nested keywords are all reported."""
+        matcher = KeywordMatcher(['sentry', 'testsentry', 'llama', 'ollama'])
+
+        assert matcher.findall("testsentry") == {'sentry', 'testsentry'}
+        assert matcher.findall("ollama") == {'llama', 'ollama'}
+
+    def test_ignore_case(self):
+        """Case-insensitive matchers report the keywords as given."""
+        matcher = KeywordMatcher(['github', 'pytest'], ignore_case=True)
+
+        assert matcher.findall("Pushed to GitHub, ran PyTest") == {'github', 'pytest'}
+        assert matcher.search("GITHUB")
+        assert not matcher.search("gitlab")
+
+    def test_no_keywords_never_match(self):
+        """A matcher without keywords finds nothing, like an empty any()."""
+        matcher = KeywordMatcher([])
+
+        assert matcher.findall("anything at all") == set()
+        assert matcher.findall("") == set()
+        assert not matcher.search("anything at all")
+        assert not matcher.search("")